@@ -1,10 +1,13 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-import pandas as pd
 import time
 
 def scrape_manually_reconstruct(date_str, output_file):
+    # pandas is only needed here; importing it lazily keeps it off the
+    # Lambda cold-start path for routes that never build a DataFrame.
+    import pandas as pd
+
     url = f"https://www.immd.gov.hk/eng/facts/passenger-statistics.html?d={date_str}"
 
     options = Options()
@@ -6,18 +6,64 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
 import xml.etree.ElementTree as ET
 import time
 import logging
 from typing import Dict, List, Optional, Any
 from abc import ABC, abstractmethod
 from datetime import date, timedelta
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Candidate selectors for a data table, most specific first
+DEFAULT_TABLE_SELECTORS = (
+    "table.data-table",
+    "table[role='grid']",
+    "div.table-container table",
+    "[class*='table']:not([class*='nav'])",
+    "table.table",
+    "table"
+)
+
+_INNER_TEXT_JS = "return arguments[0].map(e => e.innerText);"
+
+def _read_texts(driver: webdriver.Chrome, elements: List[Any]) -> List[str]:
+    """Read the stripped rendered text of many elements in one WebDriver call"""
+    if not elements:
+        return []
+    try:
+        texts = driver.execute_script(_INNER_TEXT_JS, elements)
+    except WebDriverException:
+        texts = None
+    if not isinstance(texts, list) or len(texts) != len(elements):
+        # Fall back to one call per element
+        texts = [element.text for element in elements]
+    return [(text or "").strip() for text in texts]
+
+def _read_row_texts(driver: webdriver.Chrome, rows: List[List[Any]]) -> List[List[str]]:
+    """Read the text of every cell in a list of rows with a single batched call"""
+    texts = _read_texts(driver, [cell for cells in rows for cell in cells])
+    result = []
+    start = 0
+    for cells in rows:
+        result.append(texts[start:start + len(cells)])
+        start += len(cells)
+    return result
+
+# Sites with anti-bot protection, matched anywhere in the URL
+PROTECTED_DOMAINS = ('macrotrends.net', 'investing.com', 'tradingview.com')
+
 class ExtractionStrategy(ABC):
     """Base class for extraction strategies"""
     
+    # Whether the page is a generic table lookup that a CDP-native extractor
+    # (PlaywrightExtractor) can handle instead of this strategy. Such
+    # strategies also accept page_loaded=True in extract(), to read a page
+    # the caller has already navigated to.
+    supports_cdp = False
+    
     @abstractmethod
     def extract(self, driver: webdriver.Chrome, url: str) -> Optional[Dict[str, Any]]:
         """Extract data from the given URL"""
@@ -26,19 +72,16 @@ class ExtractionStrategy(ABC):
 class DynamicTableStrategy(ExtractionStrategy):
     """Strategy for extracting data from JavaScript-rendered tables"""
     
+    supports_cdp = True
+    
     def __init__(self, wait_time: int = 20):
         self.wait_time = wait_time
-        self.table_selectors = [
-            "table.data-table",
-            "table[role='grid']",
-            "div.table-container table",
-            "[class*='table']:not([class*='nav'])",
-            "table.table",
-            "table"
-        ]
+        self.table_selectors = DEFAULT_TABLE_SELECTORS
     
-    def extract(self, driver: webdriver.Chrome, url: str) -> Optional[Dict[str, Any]]:
-        driver.get(url)
+    def extract(self, driver: webdriver.Chrome, url: str,
+                page_loaded: bool = False) -> Optional[Dict[str, Any]]:
+        if not page_loaded:
+            driver.get(url)
         wait = WebDriverWait(driver, self.wait_time)
         
         # Try multiple selectors
@@ -65,16 +108,16 @@ class DynamicTableStrategy(ExtractionStrategy):
             first_row = table.find_element(By.TAG_NAME, "tr")
             header_elements = first_row.find_elements(By.TAG_NAME, "td")
         
-        headers = [h.text.strip() for h in header_elements if h.text.strip()]
+        headers = [h for h in _read_texts(driver, header_elements) if h]
         
         # Extract data rows
         rows = table.find_elements(By.TAG_NAME, "tr")
+        row_cells = [row.find_elements(By.TAG_NAME, "td") for row in rows]
+        row_texts = _read_row_texts(driver, row_cells)
         data = []
         
-        for i, row in enumerate(rows):
-            cells = row.find_elements(By.TAG_NAME, "td")
+        for i, (cells, row_data) in enumerate(zip(row_cells, row_texts)):
             if cells and len(cells) > 0:
-                row_data = [cell.text.strip() for cell in cells]
                 # Skip if row is likely a header row
                 if i == 0 and not headers:
                     headers = row_data
@@ -161,8 +204,8 @@ class WikipediaTableStrategy(ExtractionStrategy):
         self.table_identifier = table_identifier
     
     def extract(self, driver: webdriver.Chrome, url: str) -> Optional[Dict[str, Any]]:
+        # Wikipedia tables are server-rendered, so they exist once get() returns
         driver.get(url)
-        time.sleep(2)  # Allow page to load
         
         # Find all wikitable elements
         tables = driver.find_elements(By.CSS_SELECTOR, "table.wikitable")
@@ -175,9 +218,9 @@ class WikipediaTableStrategy(ExtractionStrategy):
         
         if self.table_identifier:
             # Look for table containing specific text
+            needle = self.table_identifier.lower()
             for table in tables:
-                table_text = table.text.lower()
-                if self.table_identifier.lower() in table_text:
+                if needle in table.text.lower():
                     target_table = table
                     break
         else:
@@ -192,18 +235,15 @@ class WikipediaTableStrategy(ExtractionStrategy):
         headers = []
         header_row = target_table.find_element(By.TAG_NAME, "tr")
         header_elements = header_row.find_elements(By.TAG_NAME, "th")
-        headers = [h.text.strip() for h in header_elements]
+        headers = _read_texts(driver, header_elements)
         
         # Extract data
         rows = target_table.find_elements(By.TAG_NAME, "tr")[1:]  # Skip header row
+        # One call for both cell kinds, in document order
+        row_cells = [row.find_elements(By.XPATH, "./td|./th") for row in rows]
         data = []
         
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if not cells:
-                cells = row.find_elements(By.TAG_NAME, "th")
-            
-            row_data = [cell.text.strip() for cell in cells]
+        for row_data in _read_row_texts(driver, row_cells):
             if row_data and any(row_data):  # Skip empty rows
                 data.append(row_data)
         
@@ -254,32 +294,37 @@ class StrategyFactory:
     @staticmethod
     def get_strategy(url: str, data_identifier: Optional[str] = None) -> ExtractionStrategy:
         """Select strategy based on URL and data identifier"""
-        
-        url_lower = url.lower()
-        
-        # XML files
-        if url_lower.endswith('.xml'):
-            return XMLStrategy()
-        
-        # Wikipedia
-        if 'wikipedia.org' in url_lower:
-            return WikipediaTableStrategy(data_identifier)
-        
-        # Protected sites (known patterns)
-        protected_domains = ['macrotrends.net', 'investing.com', 'tradingview.com']
-        if any(domain in url_lower for domain in protected_domains):
-            return ProtectedSiteStrategy()
-        
-        # Singapore statistics (requires JavaScript)
-        if 'singstat.gov.sg' in url_lower:
-            return DynamicTableStrategy(wait_time=30)
-        
-        # Hong Kong Immigration Department
-        if 'immd.gov.hk' in url_lower or 'data.gov.hk' in url_lower and 'hk-immd' in url_lower:
-            return HKImmigrationStrategy(data_identifier)
-        
-        # Default strategy
-        return DynamicTableStrategy()
+        # Strategies hold only their configuration, so one instance per
+        # (url, identifier) can be shared by repeated and concurrent calls
+        return _select_strategy(url.lower(), data_identifier)
+
+
+@lru_cache(maxsize=256)
+def _select_strategy(url_lower: str, data_identifier: Optional[str]) -> ExtractionStrategy:
+    """Select the strategy for a lowercased URL; cached per (url, identifier)"""
+    
+    # XML files
+    if url_lower.endswith('.xml'):
+        return XMLStrategy()
+    
+    # Wikipedia
+    if 'wikipedia.org' in url_lower:
+        return WikipediaTableStrategy(data_identifier)
+    
+    # Protected sites (known patterns)
+    if any(domain in url_lower for domain in PROTECTED_DOMAINS):
+        return ProtectedSiteStrategy()
+    
+    # Singapore statistics (requires JavaScript)
+    if 'singstat.gov.sg' in url_lower:
+        return DynamicTableStrategy(wait_time=30)
+    
+    # Hong Kong Immigration Department
+    if 'immd.gov.hk' in url_lower or 'data.gov.hk' in url_lower and 'hk-immd' in url_lower:
+        return HKImmigrationStrategy(data_identifier)
+    
+    # Default strategy
+    return DynamicTableStrategy()
 
 
 class HKImmigrationStrategy(ExtractionStrategy):
@@ -0,0 +1,63 @@
+"""
+Browser-less HTML table parsing shared by the web extractors.
+
+Kept free of Selenium imports, so callers that only read the served HTML
+(simple_webscrape's static path) don't load the browser stack.
+"""
+import logging
+from typing import Iterator, List, Optional
+
+import lxml.etree
+import lxml.html
+
+logger = logging.getLogger(__name__)
+
+# Sent with static (browser-less) fetches so servers return the same HTML
+STATIC_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# Rows owned by a table, excluding rows of tables nested inside its cells
+_TABLE_ROWS_XPATH = "./thead/tr | ./tbody/tr | ./tr | ./tfoot/tr"
+
+# Markup whose text the browser does not render
+_HIDDEN_CONTENT_XPATH = (
+    ".//script | .//style"
+    " | .//*[contains(translate(@style, ' ', ''), 'display:none')]"
+)
+
+
+def parse_html(html) -> Optional[lxml.html.HtmlElement]:
+    """Parse an HTML document or fragment, or return None if lxml rejects it."""
+    try:
+        return lxml.html.fromstring(html)
+    except (ValueError, lxml.etree.ParserError) as e:
+        # ValueError: a str with an encoding declaration;
+        # ParserError: an empty or whitespace-only body
+        logger.info("Could not parse HTML: %s", e)
+        return None
+
+
+def drop_hidden_content(root):
+    """Remove scripts, styles and display:none elements under root, in place."""
+    for hidden in root.xpath(_HIDDEN_CONTENT_XPATH):
+        hidden.drop_tree()
+
+
+def iter_table_rows(table) -> Iterator[List[str]]:
+    """Yield the rendered cell texts of each row of a table parsed by lxml.
+
+    Cell text is whitespace-normalised; rows may be empty, and are left for
+    the caller to filter. A non-table element (e.g. a wrapper div matched
+    by id) is read through the first table inside it.
+    """
+    if table.tag != 'table':
+        table = next(table.iter('table'), None)
+        if table is None:
+            return
+
+    drop_hidden_content(table)
+    for row in table.xpath(_TABLE_ROWS_XPATH):
+        yield [' '.join(cell.text_content().split())
+               for cell in row.xpath("./th|./td")]
@@ -0,0 +1,176 @@
+"""
+Table extraction over the Chrome DevTools protocol with Playwright.
+
+An opt-in alternative to the Selenium-based WebExtractor for generic table
+pages: Playwright talks to Chrome over one persistent WebSocket instead of
+an HTTP round trip through chromedriver per command. Enable it for
+extract_web_table with MAGK_USE_PLAYWRIGHT=1; requires
+``pip install playwright && playwright install chromium``.
+"""
+import atexit
+import logging
+import threading
+from typing import List
+
+from .web_extractor import (
+    WebExtractionError, TimeoutError, ElementNotFoundError, sanitize_data,
+    _build_identifier_xpath, _css_candidate, _FIND_AND_READ_TABLE_FN
+)
+
+logger = logging.getLogger(__name__)
+
+# Resource types that never contribute table text
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+# Returned by _FIND_AND_READ_TABLE_JS when the lookup gives up; the shared
+# lookup's false would not end wait_for_function, which polls until truthy
+_NO_MATCH = 'no match'
+
+# The Selenium extractor's lookup, polled until it finds the table
+_FIND_AND_READ_TABLE_JS = (
+    "args => { const rows = (" + _FIND_AND_READ_TABLE_FN + ").apply(null, args);"
+    " return rows === false ? '" + _NO_MATCH + "' : rows; }"
+)
+
+
+class PlaywrightExtractor:
+    """Extracts web tables with Playwright, mirroring WebExtractor.extract_table."""
+
+    def __init__(self, headless: bool = True, timeout: int = 30):
+        """
+        Initialize the PlaywrightExtractor.
+
+        Args:
+            headless: Run browser in headless mode (required for Lambda)
+            timeout: Timeout for page load and table lookup in seconds
+        """
+        self.headless = headless
+        self.timeout = timeout
+        self._playwright = None
+        self._browser = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def extract_table(self, url: str, table_identifier: str = None
+                      ) -> List[List[str]]:
+        """
+        Extract table data from a web page.
+
+        Args:
+            url: The URL to navigate to
+            table_identifier: ID, class, CSS selector, or header/caption text
+                of the table; the first table on the page if omitted
+
+        Returns:
+            List of lists containing table data (rows and columns)
+
+        Raises:
+            TimeoutError: If the page takes too long to load
+            ElementNotFoundError: If the table cannot be found
+            WebExtractionError: For any other browser failure
+        """
+        sync_api = _import_playwright()
+        timeout_ms = self.timeout * 1000
+
+        if table_identifier:
+            identifier = sanitize_data(table_identifier)
+            lookup = [identifier, _css_candidate(identifier),
+                      _build_identifier_xpath(identifier)]
+        else:
+            # No id, class or selector to try; the XPath takes the first table
+            identifier = ''
+            lookup = [identifier, None, '//table']
+
+        context = None
+        try:
+            self._start_browser(sync_api)
+            # A fresh context per call keeps cookies and storage from leaking
+            context = self._browser.new_context()
+            page = context.new_page()
+            page.route("**/*", _route_request)
+            logger.info("Navigating to URL with Playwright: %s", url)
+            try:
+                page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+            except sync_api.TimeoutError:
+                raise TimeoutError(
+                    f"Page load timeout after {self.timeout} seconds for URL: {url}")
+
+            try:
+                handle = page.wait_for_function(
+                    _FIND_AND_READ_TABLE_JS, arg=lookup, timeout=timeout_ms)
+            except sync_api.TimeoutError:
+                raise ElementNotFoundError(f"Table with identifier '{identifier}' not found")
+            table_data = handle.json_value()
+            if table_data == _NO_MATCH:
+                raise ElementNotFoundError(f"Table with identifier '{identifier}' not found")
+
+        except sync_api.Error as e:
+            logger.error("Playwright error during extraction: %s", e)
+            raise WebExtractionError(f"Playwright error: {str(e)}")
+        finally:
+            if context is not None:
+                context.close()
+
+        logger.info("Successfully extracted %s rows from %s", len(table_data), url)
+        return sanitize_data(table_data)
+
+    def close(self):
+        """Close the browser and stop Playwright."""
+        try:
+            if self._browser is not None:
+                self._browser.close()
+            if self._playwright is not None:
+                self._playwright.stop()
+        except Exception as e:
+            logger.error("Error closing Playwright: %s", e)
+        finally:
+            self._browser = None
+            self._playwright = None
+
+    def _start_browser(self, sync_api):
+        """Launch Chromium on first use, reusing Playwright if a launch failed."""
+        if self._playwright is None:
+            self._playwright = sync_api.sync_playwright().start()
+        if self._browser is None:
+            self._browser = self._playwright.chromium.launch(
+                headless=self.headless,
+                args=['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu'])
+
+
+def _import_playwright():
+    """Import Playwright's sync API lazily, since it is an optional dependency."""
+    try:
+        from playwright import sync_api
+    except ImportError as e:
+        raise WebExtractionError(
+            "Playwright is not installed; run 'pip install playwright' "
+            "and 'playwright install chromium'") from e
+    return sync_api
+
+
+def _route_request(route):
+    """Abort downloads of resources that can't contain table text."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+# One extractor per thread: Playwright's sync API objects can only be used
+# from the thread that started them
+_thread_local = threading.local()
+
+
+def get_playwright_extractor() -> PlaywrightExtractor:
+    """Return this thread's PlaywrightExtractor, keeping its browser running between calls."""
+    extractor = getattr(_thread_local, 'extractor', None)
+    if extractor is None:
+        extractor = PlaywrightExtractor()
+        _thread_local.extractor = extractor
+        atexit.register(extractor.close)
+    return extractor
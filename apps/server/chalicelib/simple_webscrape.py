@@ -4,48 +4,88 @@ A straightforward tool to scrape table data from websites
 """
 
 import time
+import queue
+import atexit
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+import requests
 
-from dotenv import load_dotenv
-import os
+try:
+    from .html_tables import (
+        STATIC_USER_AGENT, parse_html, drop_hidden_content, iter_table_rows
+    )
+except ImportError:
+    # Run directly as a script (see __main__ below) rather than as chalicelib.simple_webscrape
+    from html_tables import (
+        STATIC_USER_AGENT, parse_html, drop_hidden_content, iter_table_rows
+    )
 
-# Load environment variables from .env file
-load_dotenv()
+# Selenium and python-dotenv are imported on first browser use, so callers
+# that only need the static HTML path never pay for loading them.
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_env_loaded = False
+
+
+def _ensure_env_loaded():
+    """Load environment variables from .env file, once."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+# Reads every row of a table inside the browser and returns the cell texts
+# in a single WebDriver round trip, instead of one call per row and cell.
+_TABLE_ROWS_JS = """
+const rowsOf = table => Array.from(table.rows, row =>
+    Array.from(row.cells, cell => cell.innerText.trim())
+).filter(row => row.some(cell => cell));
+"""
+
+_EXTRACT_TABLE_JS = _TABLE_ROWS_JS + "return rowsOf(arguments[0]);"
+
+_EXTRACT_ALL_TABLES_JS = (
+    _TABLE_ROWS_JS
+    + "return Array.from(document.querySelectorAll('table'), rowsOf);"
+)
+
 
 class SimpleWebExtractor:
     """A simple web table extractor using Selenium."""
     
-    def __init__(self, headless: bool = True, timeout: int = 10):
+    def __init__(self, headless: bool = True, timeout: int = 10,
+                 prefer_static: bool = True):
         """
         Initialize the extractor.
         
         Args:
             headless: Run browser in headless mode (no GUI)
             timeout: Maximum time to wait for elements (seconds)
+            prefer_static: Try a plain HTTP fetch before starting a browser
         """
         self.headless = headless
         self.timeout = timeout
+        self.prefer_static = prefer_static
         self.driver = None
     
     def setup_driver(self):
         """Set up Chrome WebDriver with basic options."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
+        _ensure_env_loaded()
         try:
             options = Options()
             
             if self.headless:
-                options.add_argument('--headless')
+                options.add_argument('--headless=new')
             
             # Basic Chrome options for compatibility
             options.add_argument('--no-sandbox')
@@ -53,6 +93,20 @@ class SimpleWebExtractor:
             options.add_argument('--disable-gpu')
             options.add_argument('--window-size=1920,1080')
             
+            # Only table text is needed: skip images and background work
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--disable-extensions')
+            options.add_argument('--disable-background-networking')
+            options.add_argument('--disable-features=IsolateOrigins,site-per-process')
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.default_content_setting_values.notifications': 2,
+            })
+            
+            # Return from get() once the DOM is parsed rather than after
+            # every subresource has loaded
+            options.page_load_strategy = 'eager'
+            
             # Initialize driver
             self.driver = webdriver.Chrome(options=options)
             self.driver.set_page_load_timeout(self.timeout)
@@ -67,6 +121,9 @@ class SimpleWebExtractor:
         """
         Extract all tables from a webpage.
         
+        The WebDriver is kept open so later calls can reuse it; call
+        close() (or use the extractor as a context manager) when done.
+        
         Args:
             url: The URL to scrape
             
@@ -74,6 +131,17 @@ class SimpleWebExtractor:
             List of tables, where each table is a list of rows,
             and each row is a list of cell values
         """
+        if self.prefer_static:
+            static_tables = self.extract_tables_static(url)
+            if static_tables:
+                return static_tables
+            logger.info("No tables in static HTML, falling back to browser")
+        
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        
         if not self.driver:
             self.setup_driver()
         
@@ -81,13 +149,18 @@ class SimpleWebExtractor:
             logger.info(f"Navigating to: {url}")
             self.driver.get(url)
             
-            # Wait for page to load
-            WebDriverWait(self.driver, self.timeout).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
+            # Wait only until a table is in the DOM, not for every
+            # subresource of the page to finish loading
+            try:
+                WebDriverWait(self.driver, self.timeout).until(
+                    EC.presence_of_all_elements_located((By.TAG_NAME, "table"))
+                )
+            except TimeoutException:
+                logger.warning("No tables found on the page")
+                return []
             
-            # Find all tables on the page
-            tables = self.driver.find_elements(By.TAG_NAME, "table")
+            # Read all tables on the page in one script call
+            tables = self.driver.execute_script(_EXTRACT_ALL_TABLES_JS)
             
             if not tables:
                 logger.warning("No tables found on the page")
@@ -95,24 +168,61 @@ class SimpleWebExtractor:
             
             logger.info(f"Found {len(tables)} table(s)")
             
-            all_tables_data = []
-            
-            for i, table in enumerate(tables):
-                logger.info(f"Processing table {i + 1}")
-                table_data = self._extract_table_data(table)
-                if table_data:  # Only add non-empty tables
-                    all_tables_data.append(table_data)
+            # Only keep non-empty tables
+            all_tables_data = [table_data for table_data in tables if table_data]
             
             return all_tables_data
             
         except TimeoutException:
             logger.error(f"Timeout loading page: {url}")
             raise
+        except WebDriverException as e:
+            # The browser session may be gone; drop it so the next call starts fresh
+            logger.error(f"WebDriver error extracting tables: {e}")
+            self.close()
+            raise
         except Exception as e:
             logger.error(f"Error extracting tables: {e}")
             raise
-        finally:
-            self.close()
+    
+    def extract_tables_static(self, url: str) -> List[List[List[str]]]:
+        """
+        Extract all tables from the server-rendered HTML, without a browser.
+        
+        Args:
+            url: The URL to scrape
+            
+        Returns:
+            List of tables in the same shape as extract_tables, or an empty
+            list if the page could not be fetched or has no tables (which
+            usually means they are rendered by JavaScript)
+        """
+        try:
+            logger.info(f"Fetching static HTML: {url}")
+            response = requests.get(
+                url, timeout=self.timeout,
+                headers={'User-Agent': STATIC_USER_AGENT})
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"Static fetch failed for {url}: {e}")
+            return []
+        
+        # None for a body lxml can't parse, e.g. an empty one
+        tree = parse_html(response.content)
+        if tree is None:
+            return []
+        
+        # Drop unrendered text once up front, so the browser and static
+        # paths return the same cells
+        drop_hidden_content(tree)
+        all_tables_data = []
+        for table in tree.iter('table'):
+            table_data = [row for row in iter_table_rows(table) if any(row)]
+            if table_data:
+                all_tables_data.append(table_data)
+        
+        logger.info(f"Found {len(all_tables_data)} table(s) in static HTML")
+        return all_tables_data
     
     def extract_first_table(self, url: str) -> List[List[str]]:
         """
@@ -137,22 +247,9 @@ class SimpleWebExtractor:
         Returns:
             List of rows, where each row is a list of cell values
         """
-        table_data = []
-        
         try:
-            # Get all rows from the table
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
-            
-            for row in rows:
-                # Get all cells in the row (both th and td)
-                cells = row.find_elements(By.TAG_NAME, "th") + row.find_elements(By.TAG_NAME, "td")
-                
-                if cells:
-                    # Extract text from each cell and clean it
-                    row_data = [cell.text.strip() for cell in cells]
-                    # Only add rows that have content
-                    if any(cell for cell in row_data):
-                        table_data.append(row_data)
+            # Rows with content only, cells (th and td) in document order
+            table_data = self.driver.execute_script(_EXTRACT_TABLE_JS, table_element)
             
             logger.info(f"Extracted {len(table_data)} rows from table")
             return table_data
@@ -172,6 +269,26 @@ class SimpleWebExtractor:
             finally:
                 self.driver = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Shared extractors reused by the convenience functions so repeated calls
+# don't pay a Chrome cold start per URL. A WebDriver is not thread-safe,
+# so calls through the shared instances are serialized.
+_shared_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_shared_extractor(headless: bool, timeout: int) -> SimpleWebExtractor:
+    """Return the process-wide extractor for the given settings."""
+    extractor = SimpleWebExtractor(headless=headless, timeout=timeout)
+    atexit.register(extractor.close)
+    return extractor
+
 
 # Convenience functions for quick usage
 def scrape_tables(url: str, headless: bool = True, timeout: int = 10) -> List[List[List[str]]]:
@@ -186,8 +303,8 @@ def scrape_tables(url: str, headless: bool = True, timeout: int = 10) -> List[Li
     Returns:
         List of tables, where each table is a list of rows
     """
-    extractor = SimpleWebExtractor(headless=headless, timeout=timeout)
-    return extractor.extract_tables(url)
+    with _shared_lock:
+        return _get_shared_extractor(headless, timeout).extract_tables(url)
 
 
 def scrape_first_table(url: str, headless: bool = True, timeout: int = 10) -> List[List[str]]:
@@ -202,8 +319,8 @@ def scrape_first_table(url: str, headless: bool = True, timeout: int = 10) -> Li
     Returns:
         List of rows, where each row is a list of cell values
     """
-    extractor = SimpleWebExtractor(headless=headless, timeout=timeout)
-    return extractor.extract_first_table(url)
+    with _shared_lock:
+        return _get_shared_extractor(headless, timeout).extract_first_table(url)
 
 
 # Example usage
@@ -249,6 +366,25 @@ if __name__ == "__main__":
         ("1.1.5 - Confusing Table Formats", urls_1_1_5),
     ]
     
+    # The URLs are independent, so scrape them concurrently. Each worker
+    # borrows its own extractor (a WebDriver must not be shared between
+    # threads) and every unique URL is fetched once.
+    max_workers = 4
+    extractor_pool = queue.Queue()
+    for _ in range(max_workers):
+        extractor_pool.put(SimpleWebExtractor())
+    
+    def scrape_with_pooled_extractor(url):
+        extractor = extractor_pool.get()
+        try:
+            return extractor.extract_tables(url)
+        finally:
+            extractor_pool.put(extractor)
+    
+    unique_urls = list(dict.fromkeys(url for _, urls in all_url_arrays for url in urls))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {url: executor.submit(scrape_with_pooled_extractor, url) for url in unique_urls}
+    
     for test_name, urls in all_url_arrays:
         print(f"\n{'='*60}")
         print(f"TESTING: {test_name}")
@@ -258,7 +394,7 @@ if __name__ == "__main__":
             print(f"\n--- Test {i}: {url} ---")
             try:
                 print("Scraping all tables...")
-                tables = scrape_tables(url)
+                tables = pending[url].result()
                 
                 print(f"Found {len(tables)} tables")
                 
@@ -281,3 +417,7 @@ if __name__ == "__main__":
                 print(f"Error: {e}")
             
             print(f"\n--- End Test {i} ---")
+    
+    executor.shutdown()
+    while not extractor_pool.empty():
+        extractor_pool.get().close()
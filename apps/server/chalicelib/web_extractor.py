@@ -1,20 +1,27 @@
+import json
 import logging
 import os
 import time
 import re
 import atexit
-from typing import List, Dict, Any, Optional, Union
-from functools import wraps
+import queue
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Union, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps, lru_cache
+import lxml.etree
+import requests
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, WebDriverException, NoSuchElementException,
     StaleElementReferenceException
 )
 from selenium.webdriver.chrome.service import Service
-from .extraction_strategies import StrategyFactory
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from .extraction_strategies import StrategyFactory, DynamicTableStrategy
+from .html_tables import STATIC_USER_AGENT, parse_html, iter_table_rows
 
 from dotenv import load_dotenv
 import os
@@ -27,6 +34,134 @@ logger = logging.getLogger(__name__)
 # Global registry for WebDriver cleanup
 _active_drivers = set()
 
+# XPath 1.0 has no lower-case(); translate() is used for case-insensitive
+# matching instead
+_XPATH_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_XPATH_LOWER = "abcdefghijklmnopqrstuvwxyz"
+
+def _xpath_lower(expr: str) -> str:
+    """Wrap an XPath expression so it evaluates to lowercase text."""
+    return f"translate({expr}, '{_XPATH_UPPER}', '{_XPATH_LOWER}')"
+
+
+def _xpath_literal(value: str) -> str:
+    """Quote a string as an XPath 1.0 literal.
+
+    XPath has no escape sequences, so a value containing both quote kinds is
+    built with concat().
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+@lru_cache(maxsize=256)
+def _build_identifier_xpath(identifier: str) -> str:
+    """Build the XPath matching a table by header, caption, aria-label or title text."""
+    # Quote as a literal rather than interpolating, to prevent XPath injection
+    needle = _xpath_literal(identifier.lower())
+    # 'or' short-circuits left to right, so the table's own attributes are
+    # checked before its header and caption descendants are scanned
+    return (
+        "//table["
+        f"contains({_xpath_lower('@aria-label')}, {needle})"
+        f" or contains({_xpath_lower('@title')}, {needle})"
+        f" or .//caption[contains({_xpath_lower('normalize-space(.)')}, {needle})]"
+        f" or .//th[contains({_xpath_lower('normalize-space(.)')}, {needle})]"
+        "]"
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_attribute_xpath(identifier: str) -> str:
+    """Build the XPath matching a table by its id, class or data-name attribute.
+
+    Mirrors the in-page :is() selector in _FIND_TABLE_JS, for lookups that
+    run without a browser.
+    """
+    needle = _xpath_literal(identifier)
+    return (
+        f"//table[contains(@id, {needle}) or contains(@class, {needle})"
+        f" or contains(@data-name, {needle})]"
+    )
+
+
+def _css_candidate(identifier: str) -> Optional[str]:
+    """Return the identifier if it looks like a CSS selector, else None."""
+    if identifier.startswith('.') or identifier.startswith('#') or ' ' in identifier:
+        return identifier
+    return None
+
+
+# Connections kept open to chromedriver. Selenium's default pool holds one,
+# so concurrent commands open and discard extra sockets.
+_REMOTE_POOL_MAXSIZE = 20
+
+# Heavy subresources that never contribute table text. Stylesheets are
+# deliberately not blocked: hidden-content detection and element.text
+# depend on computed styles.
+_BLOCKED_RESOURCE_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+]
+
+# Locates a table by id, class, CSS selector, the header/caption/label XPath,
+# and finally its id/class/data-name attributes via the native selector
+# matcher, returning [element, how] or null
+_FIND_TABLE_JS = """
+const [ident, css, textXpath] = arguments;
+let el = document.getElementById(ident);
+if (el) return [el, 'ID'];
+el = document.getElementsByClassName(ident)[0];
+if (el) return [el, 'class'];
+if (css) {
+    try { el = document.querySelector(css); } catch (e) { el = null; }
+    if (el) return [el, 'CSS selector'];
+}
+el = document.evaluate(textXpath, document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (el) return [el, 'text content'];
+const value = CSS.escape(ident);
+el = document.querySelector('table:is([id*="' + value + '"], [class*="' + value +
+    '"], [data-name*="' + value + '"])');
+if (el) return [el, 'attribute selector'];
+return null;
+"""
+
+# Reads a table's own rows (not those of nested tables) as rendered text in
+# one call. A non-table element is read through the first table inside it;
+# returns null if there is none so the caller can fall back
+_TABLE_GRID_JS = """
+const el = arguments[0];
+const t = el && (el.tagName === 'TABLE' ? el : el.querySelector('table'));
+if (!t) return null;
+return Array.from(t.rows, r => Array.from(r.cells,
+        c => (c.innerText || '').replace(/\\s+/g, ' ').trim()))
+    .filter(r => r.some(x => x));
+"""
+
+# Finds the table and reads its grid in one call, as a JS function of the
+# _FIND_TABLE_JS arguments; shared with PlaywrightExtractor. Returns null
+# while the table may still render, and false if the match has no table in
+# it or the loaded page's tables don't match at all.
+_FIND_AND_READ_TABLE_FN = (
+    "function () {"
+    " const found = (function () {" + _FIND_TABLE_JS + "}).apply(null, arguments);"
+    " if (!found) return document.readyState === 'complete'"
+    " && document.querySelector('table') ? false : null;"
+    " const grid = (function () {" + _TABLE_GRID_JS + "})(found[0]);"
+    " return grid === null ? false : grid;"
+    "}"
+)
+
+# _FIND_AND_READ_TABLE_FN as a self-contained expression for CDP
+# Runtime.evaluate; __ARGS__ is replaced with the JSON lookup arguments
+_ONE_SHOT_JS_TEMPLATE = "(" + _FIND_AND_READ_TABLE_FN + ").apply(null, __ARGS__)"
+
 
 class WebExtractionError(Exception):
     """Base exception for web extraction errors."""
@@ -48,15 +183,161 @@ class ElementNotFoundError(WebExtractionError):
     pass
 
 
+# Chrome flags for every driver; --headless is added per extractor
+_BASE_CHROME_ARGS = (
+    # Lambda-compatible options
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-dev-tools',
+    '--no-zygote',
+    '--window-size=1920,1080',
+    # Skip background work a one-off scraping browser never needs
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-sync',
+    '--disable-default-apps',
+    '--disable-translate',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-first-run',
+    '--blink-settings=imagesEnabled=false',
+    # Add user agent for better compatibility
+    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+)
+
+_CHROME_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+}
+
+# Local development: where to look for Chrome/Chromium
+_LOCAL_CHROME_PATHS = (
+    # Windows
+    'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
+    'C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe',
+    # Linux
+    '/usr/bin/google-chrome',
+    '/usr/bin/chromium-browser',
+    '/usr/bin/chromium',
+    # macOS
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+)
+
+
+@lru_cache(maxsize=1)
+def _find_chrome_binary() -> Optional[str]:
+    """Resolve the Chrome binary once per process; None lets Selenium decide."""
+    # Check for Lambda environment first
+    chrome_binary_path = os.environ.get('CHROME_BINARY_PATH', '/opt/chrome/chrome')
+    if os.path.exists(chrome_binary_path):
+        logger.info("Using Lambda Chrome binary: %s", chrome_binary_path)
+        return chrome_binary_path
+
+    for path in _LOCAL_CHROME_PATHS:
+        if os.path.exists(path):
+            logger.info("Using local Chrome binary: %s", path)
+            return path
+    return None
+
+
+@lru_cache(maxsize=1)
+def _find_chromedriver() -> Optional[str]:
+    """Resolve the ChromeDriver path once per process; None means use PATH."""
+    chromedriver_path = os.environ.get('CHROMEDRIVER_PATH', '/opt/chromedriver')
+    if os.path.exists(chromedriver_path):
+        logger.info("Using Lambda ChromeDriver: %s", chromedriver_path)
+        return chromedriver_path
+    # For local development, let Selenium find chromedriver in PATH
+    logger.info("Using ChromeDriver from system PATH")
+    return None
+
+
+class WebDriverPool:
+    """Bounded pools of idle Chrome drivers shared by all WebExtractors.
+
+    Drivers are pooled per launch configuration, (headless, page load
+    strategy), since neither can be changed on a running browser; each
+    configuration holds up to maxsize idle drivers. Drivers are reset
+    (cookies cleared, about:blank loaded) when checked in, and quit instead
+    when their pool is full or the session is dead.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._idle: "Dict[Tuple[bool, str], queue.LifoQueue[webdriver.Chrome]]" = {}
+        self._lock = threading.Lock()
+
+    def _queue(self, key: Tuple[bool, str]) -> "queue.LifoQueue[webdriver.Chrome]":
+        """Return the idle queue for a launch configuration, creating it if needed."""
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue(maxsize=self._maxsize)
+            return self._idle[key]
+
+    def acquire(self, key: Tuple[bool, str]) -> Optional[webdriver.Chrome]:
+        """Check out an idle driver launched with key, or return None if there is none."""
+        idle = self._queue(key)
+        while True:
+            try:
+                driver = idle.get_nowait()
+            except queue.Empty:
+                return None
+            if driver.session_id:
+                return driver
+            _quit_driver(driver)
+
+    def release(self, driver: webdriver.Chrome, key: Tuple[bool, str]):
+        """Reset a driver and check it back in, quitting it if it can't be kept."""
+        if not driver.session_id:
+            _quit_driver(driver)
+            return
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._queue(key).put_nowait(driver)
+        except (WebDriverException, queue.Full):
+            _quit_driver(driver)
+
+    def drain(self):
+        """Quit every idle driver."""
+        with self._lock:
+            queues = list(self._idle.values())
+        for idle in queues:
+            while True:
+                try:
+                    driver = idle.get_nowait()
+                except queue.Empty:
+                    break
+                _quit_driver(driver)
+
+
+def _quit_driver(driver: webdriver.Chrome):
+    """Quit a driver and drop it from the active registry."""
+    _active_drivers.discard(driver)
+    try:
+        driver.quit()
+        logger.info("WebDriver closed successfully")
+    except Exception as e:
+        logger.error("Error closing WebDriver: %s", e)
+
+
+_driver_pool = WebDriverPool(maxsize=int(os.environ.get('WEBDRIVER_POOL_SIZE', '2')))
+
+
 def cleanup_all_drivers():
     """Emergency cleanup function for all active drivers."""
     global _active_drivers
-    logger.info(f"Emergency cleanup: closing {len(_active_drivers)} active drivers")
+    # Pooled drivers are also in _active_drivers, so they are quit below
+    _driver_pool.drain()
+    logger.info("Emergency cleanup: closing %s active drivers", len(_active_drivers))
     for driver in list(_active_drivers):
         try:
             driver.quit()
         except Exception as e:
-            logger.error(f"Error during emergency cleanup: {e}")
+            logger.error("Error during emergency cleanup: %s", e)
     _active_drivers.clear()
 
 
@@ -64,53 +345,139 @@ def cleanup_all_drivers():
 atexit.register(cleanup_all_drivers)
 
 
+# Exceptions retry_with_backoff treats as transient
+_RETRYABLE_EXCEPTIONS = (TimeoutException, WebDriverException, StaleElementReferenceException)
+
+
 def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
     """Decorator to retry operations with exponential backoff."""
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(max_retries):
+            # Fast path: the first attempt usually succeeds
+            try:
+                return func(*args, **kwargs)
+            except _RETRYABLE_EXCEPTIONS as e:
+                last_exception = e
+
+            for attempt in range(1, max_retries):
+                delay = base_delay * (2 ** (attempt - 1))
+                logger.warning("Attempt %s failed: %s. Retrying in %ss...", attempt, last_exception, delay)
+                time.sleep(delay)
                 try:
                     return func(*args, **kwargs)
-                except (TimeoutException, WebDriverException, StaleElementReferenceException) as e:
+                except _RETRYABLE_EXCEPTIONS as e:
                     last_exception = e
-                    if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s...")
-                        time.sleep(delay)
-                    else:
-                        logger.error(f"All {max_retries} attempts failed. Last error: {e}")
+
+            logger.error("All %s attempts failed. Last error: %s", max_retries, last_exception)
             raise last_exception
         return wrapper
     return decorator
 
 
+# XSS vectors stripped from extracted text
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+_JS_URI_RE = re.compile(r'javascript:', re.IGNORECASE)
+_EVENT_HANDLER_RE = re.compile(r'on\w+\s*=', re.IGNORECASE)
+
+# Leading characters Excel would treat as the start of a formula
+_DANGEROUS_PREFIXES = frozenset('=+-@')
+
+
+def _sanitize_text(data: str) -> str:
+    """Strip XSS vectors from a string and neutralise spreadsheet formulas."""
+    if not data:
+        return data
+
+    # Remove potential XSS vectors. Each pattern needs one of '<', ':' or
+    # '=', so plain cell text skips the regex scans entirely.
+    if '<' in data or ':' in data or '=' in data:
+        data = _SCRIPT_RE.sub('', data)
+        data = _JS_URI_RE.sub('', data)
+        data = _EVENT_HANDLER_RE.sub('', data)
+
+    # Prevent formula injection in Excel
+    if data[:1] in _DANGEROUS_PREFIXES:
+        data = "'" + data  # Prefix with single quote to make it text
+
+    return data.strip()
+
+
+# Cell and row separators for sanitizing a whole grid as one string. The
+# joined-text patterns below cannot match across them: Python's \s counts
+# them as whitespace and DOTALL '.' would span them, so both are excluded.
+_CELL_SEP = '\x1e'
+_ROW_SEP = '\x1f'
+_GRID_SCRIPT_RE = re.compile(r'<script[^>\x1e\x1f]*>[^\x1e\x1f]*?</script>', re.IGNORECASE)
+_GRID_EVENT_HANDLER_RE = re.compile(r'on\w+[^\S\x1e\x1f]*=', re.IGNORECASE)
+
+
+def _sanitize_grid(rows: List[List[str]]) -> List[List[str]]:
+    """Sanitize a grid of cell strings with one regex pass per pattern.
+
+    Gives the same result as sanitize_data, falling back to it when a cell
+    isn't a string or already contains a separator character.
+    """
+    try:
+        joined = _ROW_SEP.join(_CELL_SEP.join(row) for row in rows)
+    except TypeError:
+        return sanitize_data(rows)
+
+    if '<' in joined or ':' in joined or '=' in joined:
+        joined = _GRID_SCRIPT_RE.sub('', joined)
+        joined = _JS_URI_RE.sub('', joined)
+        joined = _GRID_EVENT_HANDLER_RE.sub('', joined)
+
+    split_rows = [row.split(_CELL_SEP) for row in joined.split(_ROW_SEP)] if rows else []
+    if len(split_rows) != len(rows) or any(
+            len(split) != len(row) for split, row in zip(split_rows, rows)):
+        return sanitize_data(rows)
+
+    for row in split_rows:
+        for i, cell in enumerate(row):
+            # Prevent formula injection in Excel
+            if cell[:1] in _DANGEROUS_PREFIXES:
+                cell = "'" + cell
+            row[i] = cell.strip()
+    return split_rows
+
+
 def sanitize_data(data: Union[str, List, Dict]) -> Union[str, List, Dict]:
-    """Sanitize extracted data to prevent XSS and formula injection."""
+    """Sanitize extracted data to prevent XSS and formula injection.
+
+    Nested lists and dicts are copied and walked with an explicit stack, so
+    the input is left untouched and deep results can't hit the recursion limit.
+    """
     if isinstance(data, str):
-        # Remove potential XSS vectors
-        data = re.sub(r'<script[^>]*>.*?</script>', '', data, flags=re.IGNORECASE | re.DOTALL)
-        data = re.sub(r'javascript:', '', data, flags=re.IGNORECASE)
-        data = re.sub(r'on\w+\s*=', '', data, flags=re.IGNORECASE)
-        
-        # Prevent formula injection in Excel
-        if data.startswith(('=', '+', '-', '@')):
-            data = "'" + data  # Prefix with single quote to make it text
-            
-        return data.strip()
-    elif isinstance(data, list):
-        return [sanitize_data(item) for item in data]
-    elif isinstance(data, dict):
-        return {k: sanitize_data(v) for k, v in data.items()}
-    else:
+        return _sanitize_text(data)
+    if not isinstance(data, (list, dict)):
         return data
 
+    root = list(data) if isinstance(data, list) else dict(data)
+    stack = [root]
+    while stack:
+        container = stack.pop()
+        items = enumerate(container) if type(container) is list else container.items()
+        for key, value in items:
+            if type(value) is str:
+                container[key] = _sanitize_text(value)
+            elif isinstance(value, list):
+                container[key] = copy = list(value)
+                stack.append(copy)
+            elif isinstance(value, dict):
+                container[key] = copy = dict(value)
+                stack.append(copy)
+            elif isinstance(value, str):
+                container[key] = _sanitize_text(value)
+    return root
+
 
 class WebExtractor:
     """Handles web data extraction using Selenium."""
 
-    def __init__(self, headless: bool = True, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, headless: bool = True, timeout: int = 30, max_retries: int = 3,
+                 keep_alive: bool = True, prefer_static: bool = False,
+                 page_load_strategy: str = 'eager'):
         """
         Initialize the WebExtractor.
 
@@ -118,10 +485,20 @@ class WebExtractor:
             headless: Run browser in headless mode (required for Lambda)
             timeout: Default timeout for page operations in seconds
             max_retries: Maximum number of retry attempts for failed operations
+            keep_alive: Keep the browser open between extractions instead of
+                quitting it after each call; release it with close() or by
+                using the extractor as a context manager
+            prefer_static: For generic table pages, try the server-rendered
+                HTML first and only start a browser if the table is not in it
+            page_load_strategy: When driver.get() returns: 'eager' once the
+                DOM is parsed, 'normal' once every subresource has loaded
         """
         self.headless = headless
         self.timeout = timeout
         self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self.prefer_static = prefer_static
+        self._page_load_strategy = page_load_strategy
         self.driver = None
         self._unified_wait = None
 
@@ -143,16 +520,34 @@ class WebExtractor:
             TimeoutException: If the page or table takes too long to load
             ValueError: If the table cannot be found
         """
-        try:
-            logger.info(f"Starting extraction from URL: {url}")
-            self._setup_driver()
-
-            # Get appropriate extraction strategy
-            strategy = StrategyFactory.get_strategy(url, table_identifier)
-            logger.info(f"Using strategy: {strategy.__class__.__name__}")
+        # Get appropriate extraction strategy
+        strategy = StrategyFactory.get_strategy(url, table_identifier)
+
+        # Only the generic lookup can be answered from the served HTML; site
+        # strategies (Wikipedia, protected sites, XML) pick tables their own way
+        if (self.prefer_static and table_identifier
+                and isinstance(strategy, DynamicTableStrategy)):
+            table_data = self._try_static_extract(url, table_identifier)
+            if table_data:
+                logger.info("Extracted %s rows from static HTML of %s", len(table_data), url)
+                return table_data
 
-            # Extract data using strategy
-            result = strategy.extract(self.driver, url)
+        try:
+            logger.info("Starting extraction from URL: %s", url)
+            self._acquire_driver()
+            logger.info("Using strategy: %s", strategy.__class__.__name__)
+
+            # Generic table pages: find and read the table in one command,
+            # falling back to the strategy on the page already loaded
+            if strategy.supports_cdp and table_identifier:
+                table_data = self._try_one_shot(url, table_identifier)
+                if table_data:
+                    logger.info("Successfully extracted %s rows from %s", len(table_data), url)
+                    return table_data
+                result = strategy.extract(self.driver, url, page_loaded=True)
+            else:
+                # Extract data using strategy
+                result = strategy.extract(self.driver, url)
 
             if result is None:
                 raise WebExtractionError("No data extracted from the page")
@@ -170,22 +565,66 @@ class WebExtractor:
                     table_data = [sanitized_headers] + sanitized_data
                 else:
                     table_data = sanitize_data(table_data)
-                logger.info(f"Successfully extracted {len(table_data)} rows from {url}")
+                logger.info("Successfully extracted %s rows from %s", len(table_data), url)
                 return table_data
             else:
                 raise WebExtractionError("Invalid data format returned from strategy")
 
         except TimeoutException as e:
-            logger.error(f"Timeout during extraction: {str(e)}")
+            logger.error("Timeout during extraction: %s", e)
             raise TimeoutError(f"Extraction timed out: {str(e)}")
+        except TimeoutError:
+            raise
         except WebDriverException as e:
-            logger.error(f"WebDriver error during extraction: {str(e)}")
+            logger.error("WebDriver error during extraction: %s", e)
             raise WebExtractionError(f"WebDriver error: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error during extraction: {str(e)}")
+            logger.error("Unexpected error during extraction: %s", e)
             raise WebExtractionError(f"Extraction failed: {str(e)}")
         finally:
-            self._cleanup()
+            self._release_driver()
+
+    def extract_table_iter(self, url: str, table_identifier: str
+                           ) -> Iterator[List[str]]:
+        """
+        Yield a table's rows one at a time, for writers that stream rows out.
+
+        Uses the generic table lookup (ID, class, CSS, header/caption text,
+        attributes) rather than a site-specific strategy. The browser is
+        released once the table's HTML has been read, before the first row
+        is yielded.
+
+        Args:
+            url: The URL to navigate to
+            table_identifier: String to identify the table
+
+        Yields:
+            Sanitized, non-empty rows, header row first
+
+        Raises:
+            TimeoutError: If the page takes too long to load
+            ElementNotFoundError: If the table cannot be found
+            WebExtractionError: For any other browser or parse failure
+        """
+        self._acquire_driver()
+        try:
+            self._navigate_to_url(url)
+            tree = self._read_page_tree()
+            table = None
+            if tree is not None:
+                table = self._find_static_table(tree, sanitize_data(table_identifier))
+            if table is None:
+                table_element = self._find_table_element(table_identifier)
+                table = parse_html(table_element.get_attribute("outerHTML") or "")
+                if table is None:
+                    raise WebExtractionError("Could not parse the table's HTML")
+        except WebDriverException as e:
+            logger.error("WebDriver error during extraction: %s", e)
+            raise WebExtractionError(f"WebDriver error: {str(e)}")
+        finally:
+            self._release_driver()
+
+        yield from self._iter_table_rows(table)
 
     def extract_data_advanced(self, url: str, table_identifier: str = None
                             ) -> Dict[str, Any]:
@@ -205,103 +644,180 @@ class WebExtractor:
             ValueError: If the data cannot be found
         """
         try:
-            logger.info(f"Starting advanced extraction from URL: {url}")
-            self._setup_driver()
+            logger.info("Starting advanced extraction from URL: %s", url)
+            self._acquire_driver()
 
             # Get appropriate extraction strategy
             strategy = StrategyFactory.get_strategy(url, table_identifier)
-            logger.info(f"Using strategy: {strategy.__class__.__name__}")
-
-            # Extract data using strategy
-            result = strategy.extract(self.driver, url)
+            logger.info("Using strategy: %s", strategy.__class__.__name__)
+
+            if strategy.supports_cdp and table_identifier:
+                table_data = self._try_one_shot(url, table_identifier)
+                if table_data:
+                    result = {
+                        "type": "table",
+                        "headers": table_data[0],
+                        "data": table_data[1:],
+                        "rows": len(table_data) - 1,
+                        "columns": len(table_data[0])
+                    }
+                else:
+                    result = strategy.extract(self.driver, url, page_loaded=True)
+            else:
+                # Extract data using strategy
+                result = strategy.extract(self.driver, url)
 
             if result is None:
                 raise WebExtractionError("No data extracted from the page")
 
             # Sanitize the result data for security
             sanitized_result = sanitize_data(result)
-            logger.info(f"Successfully extracted data of type: {sanitized_result.get('type', 'unknown')}")
+            logger.info("Successfully extracted data of type: %s", sanitized_result.get('type', 'unknown'))
             return sanitized_result
 
         except TimeoutException as e:
-            logger.error(f"Timeout during advanced extraction: {str(e)}")
+            logger.error("Timeout during advanced extraction: %s", e)
             raise TimeoutError(f"Advanced extraction timed out: {str(e)}")
+        except TimeoutError:
+            raise
         except WebDriverException as e:
-            logger.error(f"WebDriver error during advanced extraction: {str(e)}")
+            logger.error("WebDriver error during advanced extraction: %s", e)
             raise WebExtractionError(f"WebDriver error: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error during advanced extraction: {str(e)}")
+            logger.error("Unexpected error during advanced extraction: %s", e)
             raise WebExtractionError(f"Advanced extraction failed: {str(e)}")
         finally:
+            self._release_driver()
+
+    def _try_static_extract(self, url: str, table_identifier: str
+                            ) -> Optional[List[List[str]]]:
+        """Find and parse the table in the page's HTML without a browser.
+
+        Returns None when the page can't be fetched or the table isn't in the
+        server-rendered HTML (e.g. it is built by JavaScript).
+        """
+        try:
+            response = requests.get(
+                url, timeout=min(self.timeout, 10),
+                headers={'User-Agent': STATIC_USER_AGENT})
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.info("Static fetch failed for %s, using browser: %s", url, e)
+            return None
+
+        # None for a body lxml can't parse, e.g. an empty one
+        tree = parse_html(response.content)
+        if tree is None:
+            return None
+
+        table = self._find_static_table(tree, table_identifier)
+        if table is None:
+            return None
+        return self._parse_table_tree(table) or None
+
+    def _find_static_table(self, tree, table_identifier: str):
+        """Locate a table in a parsed document, mirroring _find_table_element."""
+        tables = list(tree.iter('table'))
+        for table in tables:
+            if table.get('id') == table_identifier:
+                return table
+        for table in tables:
+            if table_identifier in table.get('class', '').split():
+                return table
+        try:
+            for xpath in (_build_identifier_xpath(table_identifier),
+                          _build_attribute_xpath(table_identifier)):
+                matches = tree.xpath(xpath)
+                if matches:
+                    return matches[0]
+        except lxml.etree.XPathError as e:
+            logger.info("Static lookup could not query for %r: %s", table_identifier, e)
+        return None
+
+    def close(self):
+        """Return the browser, including one kept alive between extractions, to the shared pool."""
+        self._cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    @property
+    def _pool_key(self) -> Tuple[bool, str]:
+        """Launch options a pooled driver must share to be reused by this extractor."""
+        return (self.headless, self._page_load_strategy)
+
+    def _acquire_driver(self):
+        """Start a browser, or reset the one kept alive from a previous call."""
+        if self.keep_alive and self.driver and self.driver.session_id:
+            try:
+                # Don't leak session state from the previous page
+                self.driver.delete_all_cookies()
+                return
+            except WebDriverException as e:
+                logger.warning("Kept-alive WebDriver is unusable, restarting: %s", e)
+                self._cleanup()
+        self._setup_driver()
+
+    def _release_driver(self):
+        """Return the browser to the shared pool unless it should be kept for the next call."""
+        if not self.keep_alive:
             self._cleanup()
 
     @retry_with_backoff(max_retries=2, base_delay=1.0)
     def _setup_driver(self):
         """Set up Selenium WebDriver with appropriate options."""
         global _active_drivers
+        if self.driver is not None and self.driver.session_id:
+            return
+
+        # Take an idle browser if one is still alive; only then launch Chrome
+        while True:
+            pooled = _driver_pool.acquire(self._pool_key)
+            if pooled is None:
+                break
+            try:
+                pooled.set_page_load_timeout(self.timeout)
+            except WebDriverException as e:
+                logger.warning("Pooled WebDriver is unusable, discarding: %s", e)
+                _quit_driver(pooled)
+                continue
+            self.driver = pooled
+            self._unified_wait = WebDriverWait(self.driver, self.timeout)
+            logger.info("Reusing pooled WebDriver")
+            return
+
         try:
             options = webdriver.ChromeOptions()
 
             if self.headless:
                 options.add_argument('--headless')
+            for argument in _BASE_CHROME_ARGS:
+                options.add_argument(argument)
 
-            # Lambda-compatible options
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--disable-web-security')
-            options.add_argument('--single-process')
-            options.add_argument('--disable-dev-tools')
-            options.add_argument('--no-zygote')
-            options.add_argument('--window-size=1920,1080')
-            
-            # Add user agent for better compatibility
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            # Return from get() once the DOM is parsed; callers wait on the
+            # table itself rather than on every image and stylesheet
+            options.page_load_strategy = self._page_load_strategy
 
-            # Lambda-specific binary paths
-            chrome_binary_path = os.environ.get(
-                'CHROME_BINARY_PATH', '/opt/chrome/chrome')
-            chromedriver_path = os.environ.get(
-                'CHROMEDRIVER_PATH', '/opt/chromedriver')
+            # Skip image downloads and decoding, and never prompt for notifications
+            options.add_experimental_option('prefs', _CHROME_PREFS)
 
-            # Check for Lambda environment first
-            if os.path.exists(chrome_binary_path):
+            chrome_binary_path = _find_chrome_binary()
+            if chrome_binary_path:
                 options.binary_location = chrome_binary_path
-                logger.info(
-                    f"Using Lambda Chrome binary: {chrome_binary_path}")
-            else:
-                # Local development: try to find Chrome/Chromium
-                local_chrome_paths = [
-                    # Windows
-                    'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
-                    'C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe',
-                    # Linux
-                    '/usr/bin/google-chrome',
-                    '/usr/bin/chromium-browser',
-                    '/usr/bin/chromium',
-                    # macOS
-                    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
-                ]
-                
-                for path in local_chrome_paths:
-                    if os.path.exists(path):
-                        options.binary_location = path
-                        logger.info(f"Using local Chrome binary: {path}")
-                        break
 
             # Set up ChromeDriver service
-            service = None
-            if os.path.exists(chromedriver_path):
-                service = Service(chromedriver_path)
-                logger.info(
-                    f"Using Lambda ChromeDriver: {chromedriver_path}")
-            else:
-                # For local development, let Selenium find chromedriver in PATH
-                logger.info("Using ChromeDriver from system PATH")
+            chromedriver_path = _find_chromedriver()
+            service = Service(chromedriver_path) if chromedriver_path else None
 
             # Initialize driver
-            self.driver = webdriver.Chrome(service=service, options=options)
+            self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+            self._widen_connection_pool()
             self.driver.set_page_load_timeout(self.timeout)
+            self._block_heavy_resources()
             
             # Register driver for cleanup and create unified wait
             _active_drivers.add(self.driver)
@@ -310,7 +826,7 @@ class WebExtractor:
             logger.info("WebDriver initialized successfully")
 
         except Exception as e:
-            logger.error(f"Failed to initialize WebDriver: {str(e)}")
+            logger.error("Failed to initialize WebDriver: %s", e)
             if self.driver:
                 try:
                     self.driver.quit()
@@ -319,41 +835,71 @@ class WebExtractor:
                 self.driver = None
             raise WebExtractionError(f"Failed to initialize WebDriver: {str(e)}")
 
+    def _widen_connection_pool(self):
+        """Let the driver keep several chromedriver connections alive at once."""
+        executor = self.driver.command_executor
+        if not isinstance(executor, RemoteConnection) or not executor.keep_alive:
+            return
+        # Resize Selenium's own manager rather than replacing it, so its TLS,
+        # timeout and proxy (including proxy auth) settings are kept. Pools
+        # are built from connection_pool_kw, so drop the ones that already exist.
+        executor._conn.connection_pool_kw["maxsize"] = _REMOTE_POOL_MAXSIZE
+        executor._conn.clear()
+
+    def _block_heavy_resources(self):
+        """Stop the browser fetching fonts, media and images at the network layer."""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd(
+                'Network.setBlockedURLs', {'urls': _BLOCKED_RESOURCE_URLS})
+        except WebDriverException as e:
+            # Only an optimisation; pages still load without it
+            logger.warning("Could not block heavy resources: %s", e)
+
     @retry_with_backoff(max_retries=2, base_delay=1.0)
     def _navigate_to_url(self, url: str):
         """Navigate to the specified URL with error handling."""
         try:
             if not self.driver:
                 raise WebExtractionError("WebDriver not initialized")
-            logger.info(f"Navigating to URL: {url}")
+            logger.info("Navigating to URL: %s", url)
             self.driver.get(url)
 
-            # Wait for page to be ready using unified wait
-            self._unified_wait.until(
-                lambda driver: (
-                    driver.execute_script("return document.readyState")
-                    == "complete"
+            # An eager get() already returns at DOMContentLoaded, so only the
+            # normal strategy needs to poll for the full load
+            if self._page_load_strategy == 'normal':
+                self._unified_wait.until(
+                    lambda driver: (
+                        driver.execute_script("return document.readyState")
+                        == "complete"
+                    )
                 )
-            )
 
             logger.info("Page loaded successfully")
 
         except TimeoutException as e:
-            logger.error(f"Timeout while loading page: {url}")
+            logger.error("Timeout while loading page: %s", url)
             raise TimeoutError(
                 f"Page load timeout after {self.timeout} seconds for URL: {url}")
         except WebDriverException as e:
-            logger.error(f"WebDriver error during navigation: {str(e)}")
+            logger.error("WebDriver error during navigation: %s", e)
             raise WebExtractionError(f"Failed to navigate to URL: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error during navigation: {str(e)}")
+            logger.error("Unexpected error during navigation: %s", e)
             raise WebExtractionError(f"Navigation failed: {str(e)}")
 
     def _extract_table_data(self, table_identifier: str) -> List[List[str]]:
         """Extract data from the identified table with retry logic."""
         try:
             logger.info(
-                f"Looking for table with identifier: {table_identifier}")
+                "Looking for table with identifier: %s", table_identifier)
+
+            # Parse the rendered page in one pass if the table is already in it
+            table_data = self._parse_table_from_page_source(table_identifier)
+            if table_data:
+                logger.info(
+                    "Successfully parsed table with %s rows from page source", len(table_data))
+                return table_data
 
             # Find table element using various strategies (includes retry logic)
             table_element = self._find_table_element(table_identifier)
@@ -362,16 +908,94 @@ class WebExtractor:
             table_data = self._parse_table_element(table_element)
 
             logger.info(
-                f"Successfully parsed table with {len(table_data)} rows")
+                "Successfully parsed table with %s rows", len(table_data))
             return table_data
 
         except ElementNotFoundError:
-            logger.error(f"Table with identifier '{table_identifier}' not found")
+            logger.error("Table with identifier '%s' not found", table_identifier)
             raise
         except Exception as e:
-            logger.error(f"Error extracting table data: {str(e)}")
+            logger.error("Error extracting table data: %s", e)
             raise WebExtractionError(f"Failed to extract table data: {str(e)}")
 
+    def _try_one_shot(self, url: str, table_identifier: str) -> Optional[List[List[str]]]:
+        """Load the page and poll the one-command lookup until the table renders.
+
+        Returns None to fall back to the strategy on the page already loaded.
+        Navigation errors, including TimeoutError, propagate: the fallback
+        would only load the same page again.
+        """
+        self._navigate_to_url(url)
+        if not isinstance(self.driver, webdriver.Chrome):
+            return None
+
+        def table_rendered(driver):
+            rows = self._extract_table_one_shot(table_identifier)
+            # Wrapped so an unreadable match ([]) still ends the wait
+            return None if rows is None else (rows,)
+
+        try:
+            rows, = self._unified_wait.until(table_rendered)
+        except TimeoutException:
+            logger.info("Table '%s' did not render for one-shot extraction, using strategy",
+                        table_identifier)
+            return None
+        return rows or None
+
+    def _extract_table_one_shot(self, table_identifier: str) -> Optional[List[List[str]]]:
+        """Find and read the table with a single CDP Runtime.evaluate.
+
+        Returns None if the table isn't in the page or has no rows yet, and an
+        empty list if it can't be read this way (the match has no table, the
+        loaded page has tables but none match, or CDP isn't available), so
+        callers polling for it can stop.
+        """
+        if not isinstance(self.driver, webdriver.Chrome):
+            return []
+
+        identifier = sanitize_data(table_identifier)
+        args = json.dumps([identifier, _css_candidate(identifier),
+                           _build_identifier_xpath(identifier)])
+        try:
+            response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": _ONE_SHOT_JS_TEMPLATE.replace("__ARGS__", args),
+                "returnByValue": True,
+            })
+        except WebDriverException as e:
+            logger.info("Runtime.evaluate failed: %s", e)
+            return []
+
+        if "exceptionDetails" in response:
+            logger.info("One-shot table script raised: %s", response["exceptionDetails"])
+            return []
+        rows = response.get("result", {}).get("value")
+        if rows is False:
+            return []
+        return _sanitize_grid(rows) if rows else None
+
+    def _read_page_tree(self):
+        """Parse the current page's HTML with lxml, or return None if it can't be read."""
+        try:
+            page_source = self.driver.page_source
+        except WebDriverException as e:
+            logger.info("Could not read page source: %s", e)
+            return None
+        return parse_html(page_source)
+
+    def _parse_table_from_page_source(self, table_identifier: str) -> List[List[str]]:
+        """Find and parse the table in the current page's HTML with lxml.
+
+        Returns an empty list if the table isn't in the DOM yet, so the caller
+        can fall back to waiting for it in the browser.
+        """
+        tree = self._read_page_tree()
+        if tree is None:
+            return []
+        table = self._find_static_table(tree, sanitize_data(table_identifier))
+        if table is None:
+            return []
+        return self._parse_table_tree(table)
+
     @retry_with_backoff(max_retries=2, base_delay=1.0)
     def _find_table_element(self, table_identifier: str):
         """Find table element using multiple strategies with unified timeout."""
@@ -380,149 +1004,227 @@ class WebExtractor:
         
         # Sanitize the identifier to prevent XSS
         table_identifier = sanitize_data(table_identifier)
-        logger.info(f"Searching for table with sanitized identifier: {table_identifier}")
-
-        # Strategy 1: Find by ID
-        try:
-            table = self._unified_wait.until(EC.presence_of_element_located(
-                (By.ID, table_identifier)))
-            logger.info(f"Found table by ID: {table_identifier}")
-            return table
-        except TimeoutException:
-            pass
+        logger.info("Searching for table with sanitized identifier: %s", table_identifier)
 
-        # Strategy 2: Find by class name
+        # Try every lookup in one in-page script, re-run by a single wait, so
+        # a missing table costs one timeout rather than one per strategy
+        css = _css_candidate(table_identifier)
+        text_xpath = _build_identifier_xpath(table_identifier)
         try:
-            table = self._unified_wait.until(EC.presence_of_element_located(
-                (By.CLASS_NAME, table_identifier)))
-            logger.info(f"Found table by class: {table_identifier}")
-            return table
-        except TimeoutException:
-            pass
-
-        # Strategy 3: Find by CSS selector
-        if (table_identifier.startswith('.') or
-                table_identifier.startswith('#') or
-                ' ' in table_identifier):
-            try:
-                table = self._unified_wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, table_identifier)))
-                logger.info(
-                    f"Found table by CSS selector: {table_identifier}")
-                return table
-            except TimeoutException:
-                pass
-
-        # Strategy 4: Find by partial text in table or nearby elements
-        try:
-            # Look for text content that might identify the table
-            # Escape special characters to prevent XPath injection
-            escaped_identifier = table_identifier.replace("'", "\'").replace('"', '\"')
-            xpath = f"//table[contains(text(), '{escaped_identifier}')]"
-            table = self._unified_wait.until(
-                EC.presence_of_element_located((By.XPATH, xpath))
+            table, matched_by = self._unified_wait.until(
+                lambda driver: driver.execute_script(
+                    _FIND_TABLE_JS, table_identifier, css, text_xpath)
             )
-            logger.info(
-                f"Found table by text content: {table_identifier}")
-            return table
-        except TimeoutException:
-            pass
-
-        # Strategy 5: Find by data attributes (fixed XPath syntax)
-        try:
-            # Use proper XPath syntax for data attributes
-            escaped_identifier = table_identifier.replace("'", "\'").replace('"', '\"')
-            xpath = f"//table[@*[contains(., '{escaped_identifier}')]]"
-            table = self._unified_wait.until(
-                EC.presence_of_element_located((By.XPATH, xpath))
-            )
-            logger.info(
-                f"Found table by data attribute: {table_identifier}")
+            logger.info("Found table by %s: %s", matched_by, table_identifier)
             return table
         except TimeoutException:
             pass
 
         logger.warning(
-            f"Could not find table with identifier: {table_identifier}")
+            "Could not find table with identifier: %s", table_identifier)
         raise ElementNotFoundError(f"Table with identifier '{table_identifier}' not found")
 
     def _parse_table_element(self, table_element) -> List[List[str]]:
         """Parse table element and extract data with security sanitization."""
-        table_data = []
-
         try:
-            # Look for tbody first, fallback to table
-            tbody = table_element.find_elements(By.TAG_NAME, "tbody")
-            if tbody:
-                rows = tbody[0].find_elements(By.TAG_NAME, "tr")
-            else:
-                rows = table_element.find_elements(By.TAG_NAME, "tr")
-
-            # Extract header row if exists
-            thead = table_element.find_elements(By.TAG_NAME, "thead")
-            if thead:
-                header_rows = thead[0].find_elements(By.TAG_NAME, "tr")
-                for row in header_rows:
-                    cells = (
-                        row.find_elements(By.TAG_NAME, "th") or
-                        row.find_elements(By.TAG_NAME, "td")
-                    )
-                    row_data = [sanitize_data(cell.text.strip()) for cell in cells]
-                    if row_data and any(row_data):  # Only add non-empty rows
-                        table_data.append(row_data)
-
-            # Extract data rows
-            for row in rows:
-                cells = (
-                    row.find_elements(By.TAG_NAME, "td") or
-                    row.find_elements(By.TAG_NAME, "th")
-                )
-                row_data = [sanitize_data(cell.text.strip()) for cell in cells]
-                if row_data and any(row_data):  # Only add non-empty rows
-                    table_data.append(row_data)
-
-            # Remove completely empty rows
-            table_data = [
-                row for row in table_data
-                if any(cell for cell in row)
-            ]
+            # Let the browser build the grid in a single call; it already
+            # knows which text is rendered
+            if self.driver:
+                grid = self.driver.execute_script(_TABLE_GRID_JS, table_element)
+                if grid is not None:
+                    return _sanitize_grid(grid)
 
-            return table_data
+            # Otherwise fetch the whole table in one WebDriver call and walk
+            # it locally, instead of one round trip per row and per cell
+            html = table_element.get_attribute("outerHTML")
+            return self._parse_table_html(html)
 
         except StaleElementReferenceException as e:
-            logger.error(f"Stale element reference during parsing: {str(e)}")
+            logger.error("Stale element reference during parsing: %s", e)
             raise WebExtractionError(f"Table element became stale: {str(e)}")
         except Exception as e:
-            logger.error(f"Error parsing table element: {str(e)}")
+            logger.error("Error parsing table element: %s", e)
             raise WebExtractionError(f"Failed to parse table data: {str(e)}")
 
+    def _parse_table_html(self, html: str) -> List[List[str]]:
+        """Parse a table's outerHTML into sanitized, non-empty rows."""
+        table = parse_html(html) if html else None
+        if table is None:
+            return []
+        return self._parse_table_tree(table)
+
+    def _parse_table_tree(self, table) -> List[List[str]]:
+        """Parse a table parsed by lxml into sanitized, non-empty rows."""
+        return list(self._iter_table_rows(table))
+
+    def _iter_table_rows(self, table) -> Iterator[List[str]]:
+        """Yield the sanitized, non-empty rows of a table parsed by lxml."""
+        for row in iter_table_rows(table):
+            row_data = [sanitize_data(cell) for cell in row]
+            if any(row_data):  # Only add non-empty rows
+                yield row_data
+
     def _cleanup(self):
-        """Clean up resources with proper error handling."""
-        global _active_drivers
+        """Return the driver to the shared pool, which quits it if it can't be kept."""
         if self.driver:
             try:
-                # Remove from active drivers registry
-                _active_drivers.discard(self.driver)
-                self.driver.quit()
-                logger.info("WebDriver closed successfully")
+                _driver_pool.release(self.driver, self._pool_key)
             except Exception as e:
-                logger.error(f"Error closing WebDriver: {str(e)}")
+                logger.error("Error releasing WebDriver: %s", e)
             finally:
                 self.driver = None
                 self._unified_wait = None
 
 
+# Warm extractors kept between extract_web_table calls, so a warm Lambda
+# container pays the Chrome launch cost once rather than per request
+_EXTRACTOR_POOL_SIZE = int(os.environ.get('WEBEXTRACTOR_POOL_SIZE', '2'))
+_extractor_pool: "queue.LifoQueue[WebExtractor]" = queue.LifoQueue(maxsize=_EXTRACTOR_POOL_SIZE)
+
+
+def get_extractor() -> WebExtractor:
+    """Take a warm extractor from the pool, or create one if the pool is empty."""
+    try:
+        return _extractor_pool.get_nowait()
+    except queue.Empty:
+        return WebExtractor(keep_alive=True, prefer_static=True)
+
+
+def release_extractor(extractor: WebExtractor):
+    """Return an extractor to the pool, closing it if the pool is already full."""
+    try:
+        _extractor_pool.put_nowait(extractor)
+    except queue.Full:
+        extractor.close()
+
+
+def close_extractor_pool():
+    """Close every pooled extractor and empty the pool."""
+    while True:
+        try:
+            extractor = _extractor_pool.get_nowait()
+        except queue.Empty:
+            break
+        extractor.close()
+
+
+atexit.register(close_extractor_pool)
+
+
+# Recent extract_web_table results, so identical requests within a warm
+# container don't reload the page. A TTL of 0 disables caching.
+_RESULT_CACHE_TTL = float(os.environ.get('WEBEXTRACTOR_CACHE_TTL', '300'))
+_RESULT_CACHE_SIZE = 128
+_result_cache: "OrderedDict[Tuple[str, str], Tuple[float, List[List[str]]]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _get_cached_result(key: Tuple[str, str]) -> Optional[List[List[str]]]:
+    """Return a copy of a cached, unexpired result, or None."""
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, table_data = entry
+        if expires_at < time.monotonic():
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+    return [list(row) for row in table_data]
+
+
+def _store_cached_result(key: Tuple[str, str], table_data: List[List[str]]):
+    """Cache a result, evicting the least recently used entry when full."""
+    with _result_cache_lock:
+        _result_cache[key] = (time.monotonic() + _RESULT_CACHE_TTL,
+                              [list(row) for row in table_data])
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+def clear_extraction_cache():
+    """Forget all cached extract_web_table results."""
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
+def _use_playwright(url: str, table_identifier: str) -> bool:
+    """Whether MAGK_USE_PLAYWRIGHT is set and the page needs no special strategy."""
+    if os.environ.get('MAGK_USE_PLAYWRIGHT') != '1':
+        return False
+    return StrategyFactory.get_strategy(url, table_identifier).supports_cdp
+
+
 def extract_web_table(url: str,
-                      table_identifier: str) -> List[List[str]]:
+                      table_identifier: str,
+                      extractor: Optional[WebExtractor] = None) -> List[List[str]]:
     """
     Convenience function to extract table data from a web page.
 
+    Reuses a pooled browser across calls instead of launching Chrome each time,
+    and returns a cached result for a repeated request within
+    WEBEXTRACTOR_CACHE_TTL seconds. With MAGK_USE_PLAYWRIGHT=1, generic table
+    pages are extracted with PlaywrightExtractor instead of Selenium.
+
     Args:
         url: The URL to navigate to
         table_identifier: String to identify the table
+        extractor: Extractor to run on, e.g. one held open by the caller for
+            a batch; defaults to one borrowed from the module pool
 
     Returns:
         List of lists containing table data
     """
-    extractor = WebExtractor()
-    return extractor.extract_table(url, table_identifier)
+    cache_key = (url, table_identifier)
+    if _RESULT_CACHE_TTL > 0:
+        cached = _get_cached_result(cache_key)
+        if cached is not None:
+            logger.info("Using cached table data for %s", url)
+            return cached
+
+    if extractor is not None:
+        table_data = extractor.extract_table(url, table_identifier)
+    elif _use_playwright(url, table_identifier):
+        # Imported here: playwright_extractor imports this module
+        from .playwright_extractor import get_playwright_extractor
+        table_data = get_playwright_extractor().extract_table(url, table_identifier)
+    else:
+        extractor = get_extractor()
+        try:
+            table_data = extractor.extract_table(url, table_identifier)
+        finally:
+            release_extractor(extractor)
+
+    if _RESULT_CACHE_TTL > 0:
+        _store_cached_result(cache_key, table_data)
+    return table_data
+
+
+def extract_web_tables(jobs: List[Tuple[str, str]],
+                       max_concurrency: Optional[int] = None) -> List[List[List[str]]]:
+    """
+    Extract several web tables concurrently, one pooled browser per worker.
+
+    Each worker borrows its own extractor, and so its own driver; a driver is
+    never shared between threads, which Selenium does not support.
+
+    Args:
+        jobs: (url, table_identifier) pairs to extract
+        max_concurrency: Maximum number of browsers running at once; defaults
+            to the extractor pool size so every worker gets a warm browser
+
+    Returns:
+        Table data for each job, in the same order as ``jobs``
+
+    Raises:
+        WebExtractionError: If any job fails
+    """
+    if not jobs:
+        return []
+
+    if max_concurrency is None:
+        max_concurrency = _EXTRACTOR_POOL_SIZE
+    workers = max(1, min(max_concurrency, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda job: extract_web_table(*job), jobs))
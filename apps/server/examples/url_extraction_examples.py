@@ -1,6 +1,7 @@
 """
 Examples demonstrating web data extraction for the analyzed URLs
 """
+import atexit
 import logging
 import sys
 import os
@@ -22,12 +23,23 @@ TEST_URLS = {
     "wikipedia": "https://en.wikipedia.org/wiki/Economy_of_China"
 }
 
+# One browser shared by every example, so only the first pays Chrome's start-up
+_EXTRACTOR = None
+
+def _get_extractor():
+    """Return the shared extractor, creating it on first use"""
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        _EXTRACTOR = WebExtractor(headless=True, timeout=30)
+        atexit.register(_EXTRACTOR.close)
+    return _EXTRACTOR
+
 def test_singapore_statistics():
     """Test Singapore statistics table extraction"""
     print("\n=== Testing Singapore Statistics ===")
     
     try:
-        extractor = WebExtractor(headless=True, timeout=30)
+        extractor = _get_extractor()
         
         # Use advanced extraction for detailed metadata
         result = extractor.extract_data_advanced(TEST_URLS["singapore_stats"])
@@ -53,7 +65,7 @@ def test_dbs_xml():
     print("\n=== Testing DBS XML Data ===")
     
     try:
-        extractor = WebExtractor(headless=True)
+        extractor = _get_extractor()
         result = extractor.extract_data_advanced(TEST_URLS["dbs_xml"])
         
         print(f"Extraction type: {result.get('type')}")
@@ -79,7 +91,7 @@ def test_macrotrends():
     print("\n=== Testing Macrotrends Data ===")
     
     try:
-        extractor = WebExtractor(headless=True)
+        extractor = _get_extractor()
         result = extractor.extract_data_advanced(TEST_URLS["macrotrends"])
         
         if result.get('type') == 'error':
@@ -101,7 +113,7 @@ def test_wikipedia():
     print("\n=== Testing Wikipedia GDP Table ===")
     
     try:
-        extractor = WebExtractor(headless=True)
+        extractor = _get_extractor()
         
         # Use table identifier to find GDP table
         result = extractor.extract_data_advanced(
@@ -140,7 +152,7 @@ def demonstrate_legacy_compatibility():
     print("\n=== Testing Legacy Compatibility ===")
     
     try:
-        extractor = WebExtractor(headless=True)
+        extractor = _get_extractor()
         
         # Use legacy method
         table_data = extractor.extract_table(TEST_URLS["wikipedia"], "GDP")
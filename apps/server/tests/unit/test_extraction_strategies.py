@@ -184,6 +184,27 @@ class TestWikipediaTableStrategy:
         assert result["headers"] == ["Province", "GDP (CNY)", "Share %"]
         assert len(result["data"]) == 1
         assert result["data"][0] == ["Guangdong", "12,910,254.9", "10.67%"]
+    
+    def test_cell_text_read_in_batched_script_calls(self, mock_driver):
+        """Test cell text comes from one script call per cell group"""
+        strategy = WikipediaTableStrategy()
+        
+        table = MockWebElement(tag_name="table")
+        header_row = MockWebElement(tag_name="tr")
+        header_row.add_elements([MockWebElement("stale", "th")])
+        data_row = MockWebElement(tag_name="tr")
+        data_row.add_elements([MockWebElement("stale", "td"), MockWebElement("stale", "td")])
+        table._elements = [header_row, data_row]
+        
+        mock_driver.find_elements.return_value = [table]
+        mock_driver.find_element.return_value = header_row
+        mock_driver.execute_script.side_effect = [[" Region "], ["Guangdong\n", "10.67%"]]
+        
+        result = strategy.extract(mock_driver, "http://en.wikipedia.org/wiki/Test")
+        
+        assert result["headers"] == ["Region"]
+        assert result["data"] == [["Guangdong", "10.67%"]]
+        assert mock_driver.execute_script.call_count == 2
 
 class TestProtectedSiteStrategy:
     """Test protected site handling"""
@@ -211,6 +232,16 @@ class TestStrategyFactory:
         strategy = StrategyFactory.get_strategy("http://test.com/data.xml")
         assert isinstance(strategy, XMLStrategy)
     
+    def test_strategy_reused_for_repeated_url(self):
+        """Test repeated selections for the same URL and identifier share one strategy"""
+        first = StrategyFactory.get_strategy("http://en.wikipedia.org/wiki/Test", "GDP")
+        second = StrategyFactory.get_strategy("HTTP://EN.WIKIPEDIA.ORG/wiki/Test", "GDP")
+        other = StrategyFactory.get_strategy("http://en.wikipedia.org/wiki/Test", "Population")
+        
+        assert first is second
+        assert other is not first
+        assert other.table_identifier == "Population"
+    
     def test_select_wikipedia_strategy(self):
         """Test Wikipedia strategy selection"""
         strategy = StrategyFactory.get_strategy("http://en.wikipedia.org/wiki/Test")
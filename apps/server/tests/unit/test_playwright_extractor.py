@@ -0,0 +1,75 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from chalicelib.playwright_extractor import PlaywrightExtractor, get_playwright_extractor
+from chalicelib.web_extractor import WebExtractionError, ElementNotFoundError
+
+
+class FakePlaywrightError(Exception):
+    pass
+
+
+class FakePlaywrightTimeout(FakePlaywrightError):
+    pass
+
+
+def _fake_sync_api(playwright):
+    """Build a stand-in for playwright.sync_api around a mocked Playwright."""
+    return SimpleNamespace(
+        Error=FakePlaywrightError, TimeoutError=FakePlaywrightTimeout,
+        sync_playwright=Mock(return_value=Mock(start=Mock(return_value=playwright))))
+
+
+class TestPlaywrightExtractor:
+    """Test cases for PlaywrightExtractor."""
+
+    @patch('chalicelib.playwright_extractor._import_playwright')
+    def test_launch_failure_raises_web_extraction_error(self, mock_import):
+        """Test a Chromium launch failure surfaces as WebExtractionError."""
+        playwright = Mock()
+        playwright.chromium.launch.side_effect = FakePlaywrightError("Executable doesn't exist")
+        mock_import.return_value = _fake_sync_api(playwright)
+        extractor = PlaywrightExtractor()
+
+        with pytest.raises(WebExtractionError, match="Executable doesn't exist"):
+            extractor.extract_table("https://example.com", "stats")
+
+        # A retry reuses the running Playwright instead of starting another
+        playwright.chromium.launch.side_effect = None
+        extractor._start_browser(mock_import.return_value)
+        mock_import.return_value.sync_playwright.assert_called_once()
+
+    @patch('chalicelib.playwright_extractor._import_playwright')
+    def test_extract_table_reads_grid_and_closes_context(self, mock_import):
+        """Test the table grid is returned sanitized and the context closed."""
+        playwright = Mock()
+        context = playwright.chromium.launch.return_value.new_context.return_value
+        page = context.new_page.return_value
+        page.wait_for_function.return_value.json_value.return_value = [["Year"], ["=1"]]
+        mock_import.return_value = _fake_sync_api(playwright)
+
+        result = PlaywrightExtractor().extract_table("https://example.com", "stats")
+
+        assert result == [["Year"], ["'=1"]]
+        context.close.assert_called_once()
+
+    @patch('chalicelib.playwright_extractor._import_playwright')
+    def test_loaded_page_without_match_raises_not_found(self, mock_import):
+        """Test the shared lookup's no-match result ends the wait with ElementNotFoundError."""
+        playwright = Mock()
+        page = playwright.chromium.launch.return_value.new_context.return_value.new_page.return_value
+        page.wait_for_function.return_value.json_value.return_value = 'no match'
+        mock_import.return_value = _fake_sync_api(playwright)
+
+        with pytest.raises(ElementNotFoundError):
+            PlaywrightExtractor().extract_table("https://example.com", "#stats")
+
+        assert page.wait_for_function.call_args.kwargs['arg'][1] == "#stats"
+
+    def test_extractor_reused_within_a_thread(self):
+        """Test the module-level extractor is created once per thread."""
+        assert get_playwright_extractor() is get_playwright_extractor()
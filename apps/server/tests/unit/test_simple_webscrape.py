@@ -0,0 +1,31 @@
+from unittest.mock import patch
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from chalicelib.simple_webscrape import SimpleWebExtractor
+
+
+class TestExtractTablesStatic:
+    """Test cases for the browser-less static HTML path."""
+
+    @patch('chalicelib.simple_webscrape.requests.get')
+    def test_empty_body_returns_no_tables(self, mock_get):
+        """Test an empty served page yields [] so extract_tables falls back to the browser."""
+        mock_get.return_value.content = b"  \n"
+
+        assert SimpleWebExtractor().extract_tables_static("https://example.com") == []
+
+    @patch('chalicelib.simple_webscrape.requests.get')
+    def test_unrendered_content_is_left_out(self, mock_get):
+        """Test scripts, styles and hidden elements don't reach the cells."""
+        mock_get.return_value.content = (
+            b"<html><body><table>"
+            b"<tr><th>Year</th><td>1,234<span style='display: none'>x</span></td></tr>"
+            b"<tr><td><script>var a = 1;</script></td><td></td></tr>"
+            b"</table></body></html>"
+        )
+
+        result = SimpleWebExtractor().extract_tables_static("https://example.com")
+
+        assert result == [[["Year", "1,234"]]]
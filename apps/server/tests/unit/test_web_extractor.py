@@ -8,8 +8,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from chalicelib.web_extractor import (
     WebExtractor, extract_web_table, WebExtractionError, 
-    TimeoutError, ElementNotFoundError
+    TimeoutError, ElementNotFoundError, get_extractor, release_extractor,
+    close_extractor_pool, extract_web_tables, _BLOCKED_RESOURCE_URLS,
+    _xpath_literal, clear_extraction_cache, WebDriverPool, cleanup_all_drivers,
+    sanitize_data, _sanitize_grid
 )
+from chalicelib.extraction_strategies import DynamicTableStrategy
 
 
 class TestWebExtractor:
@@ -23,6 +27,8 @@ class TestWebExtractor:
         """Clean up after tests."""
         if hasattr(self.extractor, 'driver') and self.extractor.driver:
             self.extractor.driver.quit()
+        # Quit drivers checked into the shared pool by the test
+        cleanup_all_drivers()
 
     @patch('chalicelib.web_extractor.webdriver.Chrome')
     def test_setup_driver_success(self, mock_chrome):
@@ -35,6 +41,24 @@ class TestWebExtractor:
         assert self.extractor.driver == mock_driver
         mock_driver.set_page_load_timeout.assert_called_once_with(10)
         mock_chrome.assert_called_once()
+        mock_driver.execute_cdp_cmd.assert_any_call(
+            'Network.setBlockedURLs', {'urls': _BLOCKED_RESOURCE_URLS})
+
+    def test_widen_connection_pool_keeps_selenium_settings(self):
+        """Test the chromedriver pool is resized without dropping TLS, timeout or proxy settings."""
+        from selenium.webdriver.remote.remote_connection import RemoteConnection
+        executor = RemoteConnection("http://127.0.0.1:9515", keep_alive=True)
+        manager = executor._conn
+        original_kw = dict(manager.connection_pool_kw)
+        self.extractor.driver = Mock(command_executor=executor)
+
+        self.extractor._widen_connection_pool()
+
+        assert executor._conn is manager
+        assert manager.connection_pool_kw == {**original_kw, "maxsize": 20}
+        assert manager.connection_pool_kw["cert_reqs"] == "CERT_REQUIRED"
+        pool = manager.connection_from_url("http://127.0.0.1:9515")
+        assert pool.pool.maxsize == 20
 
     @patch('chalicelib.web_extractor.webdriver.Chrome')
     def test_setup_driver_failure(self, mock_chrome):
@@ -56,17 +80,26 @@ class TestWebExtractor:
         # Execute
         self.extractor._navigate_to_url("https://example.com")
 
-        # Verify
+        # Verify: an eager get() has already waited for the DOM
         mock_driver.get.assert_called_once_with("https://example.com")
-        mock_wait_instance.until.assert_called_once()
+        mock_wait_instance.until.assert_not_called()
+
+    def test_navigate_to_url_waits_for_full_load_with_normal_strategy(self):
+        """Test the readyState wait runs for the normal page load strategy."""
+        extractor = WebExtractor(page_load_strategy='normal')
+        extractor.driver = Mock()
+        extractor._unified_wait = Mock()
+
+        extractor._navigate_to_url("https://example.com")
+
+        extractor._unified_wait.until.assert_called_once()
 
     def test_navigate_to_url_timeout(self):
         """Test URL navigation timeout."""
         mock_driver = Mock()
-        mock_wait_instance = Mock()
-        mock_wait_instance.until.side_effect = TimeoutException()
+        mock_driver.get.side_effect = TimeoutException()
         self.extractor.driver = mock_driver
-        self.extractor._unified_wait = mock_wait_instance
+        self.extractor._unified_wait = Mock()
 
         with pytest.raises(TimeoutError, match="Page load timeout"):
             self.extractor._navigate_to_url("https://example.com")
@@ -76,7 +109,8 @@ class TestWebExtractor:
         mock_driver = Mock()
         mock_wait = Mock()
         mock_table = Mock()
-        mock_wait.until.return_value = mock_table
+        mock_driver.execute_script.return_value = [mock_table, "ID"]
+        mock_wait.until.side_effect = lambda condition: condition(mock_driver)
         
         self.extractor.driver = mock_driver
         self.extractor._unified_wait = mock_wait
@@ -84,35 +118,80 @@ class TestWebExtractor:
         result = self.extractor._find_table_element("test-table")
 
         assert result == mock_table
+        # All lookup strategies run in one script call under one wait
+        mock_wait.until.assert_called_once()
+        mock_driver.execute_script.assert_called_once()
+
+    def test_extract_table_data_from_page_source(self):
+        """Test a table already in the page is parsed without element lookups."""
+        self.extractor.driver = Mock()
+        self.extractor.driver.page_source = (
+            "<html><body><table id='stats'><tr><th>Year</th></tr>"
+            "<tr><td>2024</td></tr></table></body></html>"
+        )
+        self.extractor._unified_wait = Mock()
+
+        result = self.extractor._extract_table_data("stats")
+
+        assert result == [["Year"], ["2024"]]
+        self.extractor._unified_wait.until.assert_not_called()
+
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_extract_table_iter_yields_rows(self, mock_setup):
+        """Test rows are yielded one at a time from the located table."""
+        driver = Mock()
+        driver.page_source = (
+            "<html><body><table class='stats'><tr><th>Year</th></tr>"
+            "<tr><td>=2024</td></tr></table></body></html>"
+        )
+        mock_setup.side_effect = lambda: setattr(self.extractor, "driver", driver)
+
+        rows = self.extractor.extract_table_iter("https://example.com", "stats")
+
+        assert next(rows) == ["Year"]
+        assert list(rows) == [["'=2024"]]
+        driver.get.assert_called_once_with("https://example.com")
+
+    @patch('chalicelib.web_extractor.WebExtractor._find_table_element')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_extract_table_iter_unparseable_source_uses_element_lookup(self, mock_setup, mock_find):
+        """Test page source lxml rejects falls back to the in-browser table lookup."""
+        driver = Mock()
+        # lxml refuses str input that carries an encoding declaration
+        driver.page_source = "<?xml version='1.0' encoding='utf-8'?><html><body></body></html>"
+        mock_setup.side_effect = lambda: setattr(self.extractor, "driver", driver)
+        mock_find.return_value.get_attribute.return_value = (
+            "<table><tr><th>Year</th></tr><tr><td>2024</td></tr></table>")
+
+        rows = list(self.extractor.extract_table_iter("https://example.com", "stats"))
+
+        assert rows == [["Year"], ["2024"]]
+        mock_find.assert_called_once_with("stats")
+
+    def test_extract_table_one_shot_reads_grid_via_cdp(self):
+        """Test the table is found and read in one Runtime.evaluate call."""
+        from selenium import webdriver
+        driver = Mock(spec=webdriver.Chrome)
+        driver.execute_cdp_cmd.return_value = {"result": {"type": "object", "value": [["Year"], ["=1"]]}}
+        self.extractor.driver = driver
+
+        result = self.extractor._extract_table_one_shot("stats")
+
+        assert result == [["Year"], ["'=1"]]
+        method, params = driver.execute_cdp_cmd.call_args[0]
+        assert method == "Runtime.evaluate"
+        assert params["returnByValue"] is True
+        assert '"stats"' in params["expression"]
 
     def test_parse_table_element_with_thead_tbody(self):
         """Test parsing table with proper thead/tbody structure."""
-        # Create mock table structure
         mock_table = Mock()
-
-        # Mock thead
-        mock_thead = Mock()
-        mock_header_row = Mock()
-        mock_th1, mock_th2 = Mock(), Mock()
-        mock_th1.text = "Column 1"
-        mock_th2.text = "Column 2"
-        mock_header_row.find_elements.return_value = [mock_th1, mock_th2]
-        mock_thead.find_elements.return_value = [mock_header_row]
-
-        # Mock tbody
-        mock_tbody = Mock()
-        mock_data_row = Mock()
-        mock_td1, mock_td2 = Mock(), Mock()
-        mock_td1.text = "Data 1"
-        mock_td2.text = "Data 2"
-        mock_data_row.find_elements.return_value = [mock_td1, mock_td2]
-        mock_tbody.find_elements.return_value = [mock_data_row]
-
-        # Configure table mock
-        mock_table.find_elements.side_effect = lambda by, tag: {
-            "thead": [mock_thead],
-            "tbody": [mock_tbody]
-        }.get(tag, [])
+        mock_table.get_attribute.return_value = (
+            "<table>"
+            "<thead><tr><th>Column 1</th><th>Column 2</th></tr></thead>"
+            "<tbody><tr><td>Data 1</td><td>Data 2</td></tr></tbody>"
+            "</table>"
+        )
 
         result = self.extractor._parse_table_element(mock_table)
 
@@ -121,42 +200,68 @@ class TestWebExtractor:
             ["Data 1", "Data 2"]
         ]
         assert result == expected
+        mock_table.get_attribute.assert_called_once_with("outerHTML")
 
     def test_parse_table_element_simple_structure(self):
         """Test parsing table with simple tr/td structure."""
         mock_table = Mock()
+        mock_table.get_attribute.return_value = (
+            "<table>"
+            "<tr><td>Header 1</td><td>Header 2</td></tr>"
+            "<tr><td>Value 1</td><td>Value 2</td></tr>"
+            "</table>"
+        )
+
+        result = self.extractor._parse_table_element(mock_table)
+
+        expected = [
+            ["Header 1", "Header 2"],
+            ["Value 1", "Value 2"]
+        ]
+        assert result == expected
+
+    def test_parse_table_element_skips_nested_and_hidden_content(self):
+        """Test that nested tables, hidden text and empty rows are left out."""
+        mock_table = Mock()
+        mock_table.get_attribute.return_value = (
+            "<table><tbody>"
+            "<tr><th>Region</th><td> 1,234\n <span style='display: none'>x</span></td></tr>"
+            "<tr><td>Inner</td><td><table><tr><td>Nested</td></tr></table></td></tr>"
+            "<tr><td> </td><td></td></tr>"
+            "<tr><td>=SUM(A1)</td><td><script>alert(1)</script>ok</td></tr>"
+            "</tbody></table>"
+        )
 
-        # No thead/tbody
-        mock_table.find_elements.side_effect = lambda tag: []
+        result = self.extractor._parse_table_element(mock_table)
 
-        # Mock rows directly under table
-        mock_row1, mock_row2 = Mock(), Mock()
-        mock_td1, mock_td2 = Mock(), Mock()
-        mock_td3, mock_td4 = Mock(), Mock()
+        assert result == [
+            ["Region", "1,234"],
+            ["Inner", "Nested"],
+            ["'=SUM(A1)", "ok"]
+        ]
 
-        mock_td1.text = "Header 1"
-        mock_td2.text = "Header 2"
-        mock_td3.text = "Value 1"
-        mock_td4.text = "Value 2"
+    def test_parse_table_element_reads_table_inside_wrapper(self):
+        """Test an element matched around the table (e.g. a div id) reads the table inside it."""
+        mock_wrapper = Mock()
+        mock_wrapper.get_attribute.return_value = (
+            "<div id='stats'><p>Note</p>"
+            "<table><tr><th>Year</th></tr><tr><td>2024</td></tr></table></div>"
+        )
 
-        mock_row1.find_elements.return_value = [mock_td1, mock_td2]
-        mock_row2.find_elements.return_value = [mock_td3, mock_td4]
+        result = self.extractor._parse_table_element(mock_wrapper)
 
-        # Override the find_elements for "tr" specifically
-        def side_effect(by, tag):
-            if tag == "tr":
-                return [mock_row1, mock_row2]
-            return []
+        assert result == [["Year"], ["2024"]]
 
-        mock_table.find_elements.side_effect = side_effect
+    def test_parse_table_element_uses_browser_grid(self):
+        """Test the table is read in one script call when a driver is available."""
+        mock_table = Mock()
+        self.extractor.driver = Mock()
+        self.extractor.driver.execute_script.return_value = [["Name", "=cmd"], ["Alice", "25"]]
 
         result = self.extractor._parse_table_element(mock_table)
 
-        expected = [
-            ["Header 1", "Header 2"],
-            ["Value 1", "Value 2"]
-        ]
-        assert result == expected
+        assert result == [["Name", "'=cmd"], ["Alice", "25"]]
+        mock_table.get_attribute.assert_not_called()
 
     @pytest.mark.integration
     def test_wikipedia_china_gdp_real_extraction(self):
@@ -210,15 +315,119 @@ class TestWebExtractor:
             "data": [["Data"]]
         }
         mock_strategy_factory.return_value = mock_strategy
-        
-        self.extractor.driver = Mock()
+        mock_setup.side_effect = lambda: setattr(self.extractor, "driver", Mock())
+
+        with self.extractor as extractor:
+            result = extractor.extract_table("https://example.com", "test-table")
 
-        result = self.extractor.extract_table("https://example.com", "test-table")
+            assert result == [["Header"], ["Data"]]
+            mock_setup.assert_called_once()
+            # The browser stays open until the extractor is closed
+            mock_cleanup.assert_not_called()
+
+        mock_cleanup.assert_called_once()
+
+    @patch('chalicelib.web_extractor.StrategyFactory.get_strategy')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    @patch('chalicelib.web_extractor.WebExtractor._cleanup')
+    def test_extract_table_without_keep_alive_quits_driver(self, mock_cleanup, mock_setup, mock_strategy_factory):
+        """Test keep_alive=False quits the browser after each extraction."""
+        mock_strategy_factory.return_value.extract.return_value = {"type": "table", "data": [["Data"]]}
+        extractor = WebExtractor(keep_alive=False)
+        extractor.driver = Mock()
+
+        extractor.extract_table("https://example.com", "test-table")
 
-        assert result == [["Header"], ["Data"]]
         mock_setup.assert_called_once()
         mock_cleanup.assert_called_once()
 
+    def _use_chrome_driver(self, mock_setup):
+        """Have _setup_driver install a CDP-capable mock driver with a short wait."""
+        from selenium import webdriver
+        from selenium.webdriver.support.ui import WebDriverWait
+        driver = Mock(spec=webdriver.Chrome)
+
+        def setup():
+            self.extractor.driver = driver
+            self.extractor._unified_wait = WebDriverWait(driver, 0.2, poll_frequency=0.01)
+        mock_setup.side_effect = setup
+        return driver
+
+    @patch('chalicelib.web_extractor.StrategyFactory.get_strategy')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_one_shot_polls_until_table_renders(self, mock_setup, mock_strategy_factory):
+        """Test the one-shot lookup is retried until JavaScript has built the table."""
+        driver = self._use_chrome_driver(mock_setup)
+        driver.execute_cdp_cmd.side_effect = [
+            {"result": {"type": "object", "value": None}},
+            {"result": {"type": "object", "value": [["Year"], ["2024"]]}},
+        ]
+
+        result = self.extractor.extract_table("https://example.com/stats", "stats")
+
+        assert result == [["Year"], ["2024"]]
+        driver.get.assert_called_once_with("https://example.com/stats")
+        mock_strategy_factory.return_value.extract.assert_not_called()
+
+    @patch('chalicelib.web_extractor.StrategyFactory.get_strategy')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_one_shot_miss_falls_back_without_reloading(self, mock_setup, mock_strategy_factory):
+        """Test the strategy fallback reads the page the one-shot lookup already loaded."""
+        driver = self._use_chrome_driver(mock_setup)
+        driver.execute_cdp_cmd.return_value = {"result": {"type": "object", "value": None}}
+        strategy = mock_strategy_factory.return_value
+        strategy.extract.return_value = {"type": "table", "data": [["Data"]]}
+
+        result = self.extractor.extract_table("https://example.com/stats", "stats")
+
+        assert result == [["Data"]]
+        driver.get.assert_called_once_with("https://example.com/stats")
+        strategy.extract.assert_called_once_with(driver, "https://example.com/stats", page_loaded=True)
+
+    @patch('chalicelib.web_extractor.StrategyFactory.get_strategy')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_one_shot_no_match_on_loaded_page_falls_back_at_once(self, mock_setup,
+                                                                 mock_strategy_factory):
+        """Test an identifier matching none of a loaded page's tables doesn't wait out the timeout."""
+        driver = self._use_chrome_driver(mock_setup)
+        driver.execute_cdp_cmd.return_value = {"result": {"type": "boolean", "value": False}}
+        strategy = mock_strategy_factory.return_value
+        strategy.extract.return_value = {"type": "table", "data": [["Data"]]}
+
+        result = self.extractor.extract_table("https://example.com/stats", "missing")
+
+        assert result == [["Data"]]
+        driver.execute_cdp_cmd.assert_called_once()
+        assert "readyState" in driver.execute_cdp_cmd.call_args[0][1]["expression"]
+
+    @patch('chalicelib.web_extractor.StrategyFactory.get_strategy')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_one_shot_navigation_timeout_skips_fallback(self, mock_setup, mock_strategy_factory):
+        """Test a page load timeout is raised rather than loading the page again."""
+        driver = self._use_chrome_driver(mock_setup)
+        driver.get.side_effect = TimeoutException()
+
+        with pytest.raises(TimeoutError, match="Page load timeout"):
+            self.extractor.extract_table("https://example.com/stats", "stats")
+
+        driver.get.assert_called_once()
+        mock_strategy_factory.return_value.extract.assert_not_called()
+
+    @patch('chalicelib.extraction_strategies.WikipediaTableStrategy.extract')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_wikipedia_skips_one_shot_lookup(self, mock_setup, mock_extract):
+        """Test Wikipedia pages keep the wikitable-only strategy rather than the generic lookup."""
+        from selenium import webdriver
+        driver = Mock(spec=webdriver.Chrome)
+        mock_setup.side_effect = lambda: setattr(self.extractor, "driver", driver)
+        mock_extract.return_value = {"type": "wikipedia_table", "headers": ["Year"], "data": [["2024"]]}
+
+        result = self.extractor.extract_data_advanced(
+            "https://en.wikipedia.org/wiki/Economy_of_China", "GDP")
+
+        assert result["type"] == "wikipedia_table"
+        driver.execute_cdp_cmd.assert_not_called()
+
     @pytest.mark.integration
     def test_singapore_statistics_javascript_required(self):
         """Test handling of JavaScript-required site - INTEGRATION TEST."""
@@ -257,16 +466,167 @@ class TestWebExtractor:
         with pytest.raises(TimeoutError):
             self.extractor.extract_table("https://example.com", "test-table")
 
-        mock_cleanup.assert_called_once()
+        mock_cleanup.assert_not_called()
+
+    @patch('chalicelib.web_extractor.StrategyFactory.get_strategy')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    @patch('chalicelib.web_extractor.WebExtractor._cleanup')
+    def test_extract_table_keep_alive_reuses_driver(self, mock_cleanup, mock_setup, mock_strategy_factory):
+        """Test a kept-alive extractor reuses its browser across calls."""
+        mock_strategy = Mock()
+        mock_strategy.extract.return_value = {"type": "table", "data": [["Data"]]}
+        mock_strategy_factory.return_value = mock_strategy
+
+        extractor = WebExtractor(keep_alive=True)
+        extractor.driver = Mock()
+
+        extractor.extract_table("https://example.com", "test-table")
+        extractor.extract_table("https://example.com", "test-table")
+
+        mock_setup.assert_not_called()
+        mock_cleanup.assert_not_called()
+        assert extractor.driver.delete_all_cookies.call_count == 2
+
+    @patch('chalicelib.web_extractor.requests.get')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_extract_table_static_fast_path(self, mock_setup, mock_get):
+        """Test a table present in the served HTML is extracted without a browser."""
+        mock_get.return_value.content = (
+            b"<html><body><table><tr><td>Other</td></tr></table>"
+            b"<table><caption>GDP by Year</caption><tr><th>Year</th><th>GDP</th></tr>"
+            b"<tr><td>2023</td><td>17.8</td></tr></table></body></html>"
+        )
+        extractor = WebExtractor(prefer_static=True)
+
+        result = extractor.extract_table("https://example.com", "gdp")
+
+        assert result == [["Year", "GDP"], ["2023", "17.8"]]
+        mock_setup.assert_not_called()
+
+    @patch('chalicelib.web_extractor.requests.get')
+    @patch('chalicelib.web_extractor.StrategyFactory.get_strategy')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    @patch('chalicelib.web_extractor.WebExtractor._cleanup')
+    def test_extract_table_static_miss_falls_back_to_browser(self, mock_cleanup, mock_setup,
+                                                             mock_strategy_factory, mock_get):
+        """Test a table missing from the served HTML is extracted with the browser."""
+        mock_get.return_value.content = b"<html><body><div id='app'></div></body></html>"
+        mock_strategy_factory.return_value = Mock(spec=DynamicTableStrategy)
+        mock_strategy_factory.return_value.extract.return_value = {"type": "table", "data": [["Data"]]}
+        extractor = WebExtractor(prefer_static=True)
+        mock_setup.side_effect = lambda: setattr(extractor, "driver", Mock())
+
+        result = extractor.extract_table("https://example.com", "gdp")
+
+        assert result == [["Data"]]
+        mock_get.assert_called_once()
+        mock_setup.assert_called_once()
+
+    @patch('chalicelib.web_extractor.requests.get')
+    @patch('chalicelib.web_extractor.StrategyFactory.get_strategy')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_extract_table_static_empty_body_falls_back_to_browser(self, mock_setup,
+                                                                   mock_strategy_factory, mock_get):
+        """Test an empty served page falls back to the browser instead of raising."""
+        mock_get.return_value.content = b"  \n"
+        mock_strategy_factory.return_value = Mock(spec=DynamicTableStrategy)
+        mock_strategy_factory.return_value.extract.return_value = {"type": "table", "data": [["Data"]]}
+        extractor = WebExtractor(prefer_static=True)
+        mock_setup.side_effect = lambda: setattr(extractor, "driver", Mock())
+
+        result = extractor.extract_table("https://example.com", "gdp")
+
+        assert result == [["Data"]]
+        mock_setup.assert_called_once()
+
+    @patch('chalicelib.web_extractor.requests.get')
+    @patch('chalicelib.extraction_strategies.WikipediaTableStrategy.extract')
+    @patch('chalicelib.web_extractor.WebExtractor._setup_driver')
+    def test_extract_table_static_path_skipped_for_site_strategies(self, mock_setup, mock_extract,
+                                                                   mock_get):
+        """Test site-specific strategies are not bypassed by the static fast path."""
+        mock_extract.return_value = {"type": "wikipedia_table", "headers": ["Year"], "data": [["2024"]]}
+        extractor = WebExtractor(prefer_static=True)
+        mock_setup.side_effect = lambda: setattr(extractor, "driver", Mock())
+
+        result = extractor.extract_table("https://en.wikipedia.org/wiki/Economy_of_China", "GDP")
+
+        assert result == [["Year"], ["2024"]]
+        mock_get.assert_not_called()
 
     def test_cleanup_with_driver(self):
-        """Test cleanup with active driver."""
+        """Test cleanup resets the driver and returns it to the shared pool."""
+        mock_driver = Mock()
+        self.extractor.driver = mock_driver
+
+        self.extractor._cleanup()
+
+        assert self.extractor.driver is None
+        mock_driver.delete_all_cookies.assert_called_once()
+        mock_driver.get.assert_called_once_with("about:blank")
+        mock_driver.quit.assert_not_called()
+
+    @patch('chalicelib.web_extractor.webdriver.Chrome')
+    def test_setup_driver_reuses_pooled_driver(self, mock_chrome):
+        """Test a driver released by one extractor is picked up by the next."""
         mock_driver = Mock()
         self.extractor.driver = mock_driver
+        self.extractor._cleanup()
+
+        other = WebExtractor(timeout=5)
+        other._setup_driver()
+
+        assert other.driver is mock_driver
+        mock_driver.set_page_load_timeout.assert_called_once_with(5)
+        mock_chrome.assert_not_called()
+
+    def test_driver_pool_quits_dead_and_overflow_drivers(self):
+        """Test the pool only keeps live drivers, up to its size."""
+        pool = WebDriverPool(maxsize=1)
+        dead = Mock(session_id=None)
+        kept, overflow = Mock(), Mock()
+
+        key = (True, 'eager')
+
+        pool.release(dead, key)
+        pool.release(kept, key)
+        pool.release(overflow, key)
 
+        dead.quit.assert_called_once()
+        kept.quit.assert_not_called()
+        overflow.quit.assert_called_once()
+        assert pool.acquire(key) is kept
+        assert pool.acquire(key) is None
+
+    @patch('chalicelib.web_extractor.webdriver.Chrome')
+    def test_setup_driver_discards_dead_pooled_driver(self, mock_chrome):
+        """Test a pooled browser that died while idle is quit and a new one launched."""
+        dead = Mock()
+        self.extractor.driver = dead
         self.extractor._cleanup()
+        dead.set_page_load_timeout.side_effect = WebDriverException("chrome not reachable")
+
+        other = WebExtractor()
+        other._setup_driver()
 
-        mock_driver.quit.assert_called_once()
+        assert other.driver is mock_chrome.return_value
+        assert other._unified_wait is not None
+        dead.quit.assert_called_once()
+
+    @patch('chalicelib.web_extractor.webdriver.Chrome')
+    def test_setup_driver_skips_pooled_driver_with_other_options(self, mock_chrome):
+        """Test a pooled headless, eager driver is not handed to a headed, normal extractor."""
+        pooled = Mock()
+        self.extractor.driver = pooled
+        self.extractor._cleanup()
+
+        other = WebExtractor(headless=False, page_load_strategy='normal')
+        other._setup_driver()
+
+        assert other.driver is mock_chrome.return_value
+        options = mock_chrome.call_args.kwargs['options']
+        assert '--headless' not in options.arguments
+        assert options.page_load_strategy == 'normal'
 
     def test_cleanup_without_driver(self):
         """Test cleanup without active driver."""
@@ -279,6 +639,11 @@ class TestWebExtractor:
 class TestConvenienceFunction:
     """Test cases for the convenience function."""
 
+    def teardown_method(self):
+        """Drop extractors pooled and results cached by the test."""
+        close_extractor_pool()
+        clear_extraction_cache()
+
     @patch('chalicelib.web_extractor.WebExtractor')
     def test_extract_web_table(self, mock_extractor_class):
         """Test the convenience function."""
@@ -294,6 +659,77 @@ class TestConvenienceFunction:
             "https://example.com", "test-table"
         )
 
+    @patch('chalicelib.web_extractor.WebExtractor')
+    def test_extract_web_table_reuses_pooled_extractor(self, mock_extractor_class):
+        """Test consecutive calls share one pooled extractor."""
+        mock_extractor_class.return_value.extract_table.return_value = [["Data"]]
+
+        extract_web_table("https://example.com", "first")
+        extract_web_table("https://example.com", "second")
+
+        mock_extractor_class.assert_called_once_with(keep_alive=True, prefer_static=True)
+        assert mock_extractor_class.return_value.extract_table.call_count == 2
+
+    @patch('chalicelib.web_extractor.WebExtractor')
+    def test_extract_web_table_caches_repeated_requests(self, mock_extractor_class):
+        """Test an identical request is served from the cache."""
+        mock_extractor_class.return_value.extract_table.return_value = [["Data"]]
+
+        first = extract_web_table("https://example.com", "test-table")
+        first[0][0] = "mutated"
+        second = extract_web_table("https://example.com", "test-table")
+
+        assert second == [["Data"]]
+        mock_extractor_class.return_value.extract_table.assert_called_once()
+
+    @patch('chalicelib.web_extractor.get_extractor')
+    def test_extract_web_table_uses_given_extractor(self, mock_get_extractor):
+        """Test a caller-supplied extractor is used and left open."""
+        extractor = Mock()
+        extractor.extract_table.return_value = [["Data"]]
+
+        result = extract_web_table("https://example.com", "test-table", extractor=extractor)
+
+        assert result == [["Data"]]
+        mock_get_extractor.assert_not_called()
+        extractor.close.assert_not_called()
+
+    @patch.dict(os.environ, {"MAGK_USE_PLAYWRIGHT": "1"})
+    @patch('chalicelib.web_extractor.get_extractor')
+    @patch('chalicelib.playwright_extractor.get_playwright_extractor')
+    def test_extract_web_table_uses_playwright_when_enabled(self, mock_get_playwright, mock_get_extractor):
+        """Test generic table pages go to the reused Playwright extractor when opted in."""
+        mock_playwright = mock_get_playwright.return_value
+        mock_playwright.extract_table.return_value = [["Data"]]
+
+        result = extract_web_table("https://example.com/stats", "test-table")
+
+        assert result == [["Data"]]
+        mock_playwright.extract_table.assert_called_once_with("https://example.com/stats", "test-table")
+        mock_get_extractor.assert_not_called()
+
+    @patch('chalicelib.web_extractor.extract_web_table')
+    def test_extract_web_tables_preserves_job_order(self, mock_extract):
+        """Test batch extraction returns one result per job, in order."""
+        mock_extract.side_effect = lambda url, ident: [[url, ident]]
+        jobs = [("https://a.example", "t1"), ("https://b.example", "t2"), ("https://c.example", "t3")]
+
+        result = extract_web_tables(jobs, max_concurrency=2)
+
+        assert result == [[["https://a.example", "t1"]], [["https://b.example", "t2"]], [["https://c.example", "t3"]]]
+        assert extract_web_tables([]) == []
+
+    def test_release_extractor_closes_when_pool_full(self):
+        """Test extractors beyond the pool size are closed, not kept."""
+        extractors = [Mock() for _ in range(3)]
+        for extractor in extractors:
+            release_extractor(extractor)
+
+        extractors[0].close.assert_not_called()
+        extractors[1].close.assert_not_called()
+        extractors[2].close.assert_called_once()
+        assert get_extractor() is extractors[1]
+
 
 @pytest.fixture
 def sample_table_data():
@@ -308,12 +744,59 @@ def sample_table_data():
 class TestErrorHandling:
     """Test error handling scenarios."""
 
+    def test_sanitize_data_nested_without_mutating_input(self):
+        """Test nested results are sanitized into copies, however deep."""
+        data = {"headers": ["=SUM(A1)"], "data": [[" <script>x</script>ok ", 3]], "type": "table"}
+
+        result = sanitize_data(data)
+
+        assert result == {"headers": ["'=SUM(A1)"], "data": [["ok", 3]], "type": "table"}
+        assert data["headers"] == ["=SUM(A1)"]
+
+        deep = current = []
+        for _ in range(5000):
+            current.append([])
+            current = current[0]
+        current.append("@cmd")
+        sanitize_data(deep)
+
+    def test_sanitize_grid_matches_per_cell_sanitizing(self):
+        """Test whole-grid sanitizing never lets a pattern span two cells."""
+        grid = [
+            ["on", "=SUM(A1)", " <script>x</script>ok "],
+            ["<script>", "</script>", "javascript:go"],
+            ["a\x1eb", "onclick = 1"],
+        ]
+
+        assert _sanitize_grid(grid) == sanitize_data(grid)
+        assert _sanitize_grid(grid[:2]) == [
+            ["on", "'=SUM(A1)", "ok"],
+            ["<script>", "</script>", "go"],
+        ]
+
+    def test_xpath_literal_quotes_both_quote_kinds(self):
+        """Test identifiers with quotes cannot break out of the XPath literal."""
+        assert _xpath_literal("GDP") == "'GDP'"
+        assert _xpath_literal("China's GDP") == '"China\'s GDP"'
+        assert _xpath_literal("a'] | //*[\"") == "concat('a', \"'\", '] | //*[\"')"
+
+    def test_find_static_table_matches_id_class_and_data_name(self):
+        """Test the browser-less attribute lookup matches the in-page :is() selector."""
+        import lxml.html
+        tree = lxml.html.fromstring(
+            "<div><table summary='gdp-notes'></table>"
+            "<table data-name='annual-gdp-table'><tr><td>1</td></tr></table></div>")
+
+        table = WebExtractor()._find_static_table(tree, "gdp")
+
+        assert table.get("data-name") == "annual-gdp-table"
+
     def test_empty_table_data(self):
         """Test handling of empty table data."""
         extractor = WebExtractor()
 
         mock_table = Mock()
-        mock_table.find_elements.return_value = []
+        mock_table.get_attribute.return_value = "<table></table>"
 
         result = extractor._parse_table_element(mock_table)
         assert result == []
@@ -323,7 +806,7 @@ class TestErrorHandling:
         extractor = WebExtractor()
 
         mock_table = Mock()
-        mock_table.find_elements.side_effect = Exception("Parse error")
+        mock_table.get_attribute.side_effect = Exception("Parse error")
 
         with pytest.raises(WebExtractionError, match="Failed to parse table data"):
             extractor._parse_table_element(mock_table)